@@ -3,28 +3,77 @@ Reliapy
 =======
 """
 
-import pkg_resources
-
-import reliapy.limit_state
-import reliapy.transformation
-import reliapy.distributions.continuous
-import reliapy.monte_carlo
-import reliapy._messages
-import reliapy.sampling
-
-from reliapy.limit_state import *
-from reliapy.transformation import *
-from reliapy.distributions.continuous import *
-from reliapy.monte_carlo import *
-from reliapy._messages import *
-from reliapy.sampling import *
-
-try:
-    __version__ = pkg_resources.get_distribution("reliapy").version
-except pkg_resources.DistributionNotFound:
-    __version__ = None
-
-try:
-    __version__ = pkg_resources.get_distribution("reliapy").version
-except pkg_resources.DistributionNotFound:
-    __version__ = None
+from importlib import import_module
+
+from reliapy.distributions.continuous import __all__ as _CONTINUOUS
+
+_SUBMODULES = ('limit_state', 'transformation', 'distributions', 'monte_carlo', 'sampling', 'math', '_messages')
+
+# Module where each public name is defined. The modules are imported on first access, so that `import reliapy` does not
+# import all the distributions (and numpy/scipy) when only part of the package is used.
+_EXPORTS = {
+    'LimitState': 'reliapy.limit_state',
+    'FORM': 'reliapy.transformation',
+    'FOSM': 'reliapy.transformation',
+    'Optimization': 'reliapy.transformation',
+    'MonteCarlo': 'reliapy.monte_carlo',
+    'Importance': 'reliapy.monte_carlo',
+    'Random': 'reliapy.sampling',
+    'LHS': 'reliapy.sampling',
+    'Antithetic': 'reliapy.sampling',
+    'template_error': 'reliapy._messages',
+    'type_error': 'reliapy._messages',
+    'shape_error': 'reliapy._messages',
+    'not_implemented_error': 'reliapy._messages',
+    'value_error': 'reliapy._messages',
+    'pf2beta': 'reliapy.math',
+    'beta2pf': 'reliapy.math',
+    'phi_pdf': 'reliapy.math',
+    'phi_cdf': 'reliapy.math',
+    'phi_icdf': 'reliapy.math',
+    'nataf': 'reliapy.math',
+    'normal_equivalent': 'reliapy.math',
+    'transform_xz': 'reliapy.math',
+    'numerical_gradient': 'reliapy.math',
+    'spectral_decomposition': 'reliapy.math',
+    'cholesky_decomposition': 'reliapy.math',
+    'multi_norm': 'reliapy.math',
+    'norm': 'reliapy.math',
+    'multivariate_normal': 'reliapy.math',
+}
+_EXPORTS.update({name: 'reliapy.distributions.continuous' for name in _CONTINUOUS})
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        return import_module(__name__ + '.' + name)
+
+    if name == '__version__':
+        # Looked up once, from the metadata of the installed package (importlib.metadata requires Python 3.8).
+        try:
+            from importlib.metadata import version, PackageNotFoundError
+        except ImportError:
+            import pkg_resources
+            PackageNotFoundError = pkg_resources.DistributionNotFound
+
+            def version(distribution_name):
+                return pkg_resources.get_distribution(distribution_name).version
+
+        try:
+            value = version("reliapy")
+        except PackageNotFoundError:
+            value = None
+    elif name in _EXPORTS:
+        value = getattr(import_module(_EXPORTS[name]), name)
+    else:
+        raise AttributeError('module ' + __name__ + ' has no attribute ' + name)
+
+    globals()[name] = value
+
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_SUBMODULES) | set(__all__) | {'__version__'})
@@ -1,5 +1,28 @@
-import reliapy.distributions.continuous
-import reliapy.distributions.joint_distribution
+from importlib import import_module
 
-from reliapy.distributions.continuous import *
-from reliapy.distributions.joint_distribution import *
\ No newline at end of file
+from reliapy.distributions.continuous import __all__ as _CONTINUOUS
+
+_SUBMODULES = ('continuous', 'joint_distribution')
+
+__all__ = ['JointDistribution'] + _CONTINUOUS
+
+
+def __getattr__(name):
+    # The submodules, the joint distribution and the continuous distributions are imported on first access.
+    if name in _SUBMODULES:
+        return import_module(__name__ + '.' + name)
+
+    if name == 'JointDistribution':
+        value = import_module(__name__ + '.joint_distribution').JointDistribution
+    elif name in _CONTINUOUS:
+        value = getattr(import_module(__name__ + '.continuous'), name)
+    else:
+        raise AttributeError('module ' + __name__ + ' has no attribute ' + name)
+
+    globals()[name] = value
+
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_SUBMODULES) | set(__all__))
@@ -1,108 +1,128 @@
-from reliapy.distributions.continuous._continuous import _Continuous
-from reliapy.distributions.continuous._normal import Normal
-from reliapy.distributions.continuous._alpha import Alpha
-from reliapy.distributions.continuous._anglit import Anglit
-from reliapy.distributions.continuous._arcsine import ArcSine
-from reliapy.distributions.continuous._argus import Argus
-from reliapy.distributions.continuous._beta import Beta
-from reliapy.distributions.continuous._betaprime import BetaPrime
-from reliapy.distributions.continuous._bradford import Bradford
-from reliapy.distributions.continuous._burr import Burr
-from reliapy.distributions.continuous._burr12 import Burr12
-from reliapy.distributions.continuous._cauchy import Cauchy
-from reliapy.distributions.continuous._chi import Chi
-from reliapy.distributions.continuous._chi2 import Chi2
-from reliapy.distributions.continuous._cosine import Cosine
-from reliapy.distributions.continuous._crystalball import Crystalball
-from reliapy.distributions.continuous._dgamma import DGamma
-from reliapy.distributions.continuous._dweibull import DWeibull
-from reliapy.distributions.continuous._erlang import Erlang
-from reliapy.distributions.continuous._expon import Expon
-from reliapy.distributions.continuous._exponnorm import ExponNorm
-from reliapy.distributions.continuous._exponpow import ExponPow
-from reliapy.distributions.continuous._exponweib import ExponWeib
-from reliapy.distributions.continuous._f import F
-from reliapy.distributions.continuous._fatiguelife import FatigueLife
-from reliapy.distributions.continuous._fisk import Fisk
-from reliapy.distributions.continuous._foldcauchy import FoldCauchy
-from reliapy.distributions.continuous._foldnorm import FoldNorm
-from reliapy.distributions.continuous._genlogistic import GenLogistic
-from reliapy.distributions.continuous._gennorm import GenNorm
-from reliapy.distributions.continuous._genpareto import GenPareto
+"""
+One-dimensional continuous distributions. Each distribution is imported from its module on first access, so that
+importing the package does not import all the modules (and scipy.stats).
+"""
 
-from reliapy.distributions.continuous._gamma import Gamma
-from reliapy.distributions.continuous._gausshyper import GaussHyper
-from reliapy.distributions.continuous._genexpon import GenExpon
-from reliapy.distributions.continuous._genextreme import GenExtreme
-from reliapy.distributions.continuous._gengamma import GenGamma
-from reliapy.distributions.continuous._genhalflogistic import GenHalfLogistic
-from reliapy.distributions.continuous._genhyperbolic import GenHyperbolic
-from reliapy.distributions.continuous._geninvgauss import GenInvGauss
-from reliapy.distributions.continuous._gilbrat import Gilbrat
-from reliapy.distributions.continuous._gompertz import Gompertz
-from reliapy.distributions.continuous._gumbel_l import Gumbel_L
-from reliapy.distributions.continuous._gumbel_r import Gumbel_R
-from reliapy.distributions.continuous._halfcauchy import HalfCauchy
-from reliapy.distributions.continuous._halfgennorm import HalfGenNorm
-from reliapy.distributions.continuous._halflogistic import HalfLogistic
-from reliapy.distributions.continuous._halfnorm import HalfNorm
-from reliapy.distributions.continuous._hypsecant import HypSecant
-from reliapy.distributions.continuous._invgamma import InvGamma
-from reliapy.distributions.continuous._invgauss import InvGauss
-from reliapy.distributions.continuous._invweibull import InvWeibull
-from reliapy.distributions.continuous._johnsonsb import JohnsonsB
-from reliapy.distributions.continuous._johnsonsu import JohnsonsU
-from reliapy.distributions.continuous._kappa3 import Kappa3
-from reliapy.distributions.continuous._kappa4 import Kappa4
-from reliapy.distributions.continuous._ksone import KSone
-from reliapy.distributions.continuous._kstwo import KStwo
-from reliapy.distributions.continuous._kstwobign import KStwoBign
-from reliapy.distributions.continuous._laplace import Laplace
-from reliapy.distributions.continuous._laplace_asymmetric import LaplaceAsymmetric
-from reliapy.distributions.continuous._levy import Levy
-from reliapy.distributions.continuous._levy_l import Levy_L
-from reliapy.distributions.continuous._levy_stable import LevyStable
-from reliapy.distributions.continuous._loggamma import LogGamma
-from reliapy.distributions.continuous._logistic import Logistic
-from reliapy.distributions.continuous._loglaplace import LogLaplace
-from reliapy.distributions.continuous._lognormal import LogNormal
-from reliapy.distributions.continuous._loguniform import LogUniform
-from reliapy.distributions.continuous._lomax import Lomax
-from reliapy.distributions.continuous._maxwell import Maxwell
-from reliapy.distributions.continuous._mielke import Mielke
-from reliapy.distributions.continuous._moyal import Moyal
-from reliapy.distributions.continuous._nakagami import Nakagami
-from reliapy.distributions.continuous._ncf import NCF
-from reliapy.distributions.continuous._nct import NCT
-from reliapy.distributions.continuous._ncx2 import NCX2
-from reliapy.distributions.continuous._norminvgauss import NormInvGauss
-from reliapy.distributions.continuous._pareto import Pareto
-from reliapy.distributions.continuous._pearson3 import Pearson3
-from reliapy.distributions.continuous._powerlaw import PowerLaw
-from reliapy.distributions.continuous._powerlognormal import PowerLogNormal
-from reliapy.distributions.continuous._rayleigh import Rayleigh
-from reliapy.distributions.continuous._rdist import RDist
-from reliapy.distributions.continuous._recipinvgauss import RecipInvGauss
-from reliapy.distributions.continuous._rice import Rice
-from reliapy.distributions.continuous._semicircular import SemiCircular
-from reliapy.distributions.continuous._skewcauchy import SkewCauchy
-from reliapy.distributions.continuous._skewnormal import SkewNormal
-from reliapy.distributions.continuous._studentized_range import StudentizedRange
-from reliapy.distributions.continuous._t import T
-from reliapy.distributions.continuous._trapezoid import Trapezoid
-from reliapy.distributions.continuous._triang import Triang
-from reliapy.distributions.continuous._truncexpon import TruncExpon
-from reliapy.distributions.continuous._truncnormal import TruncNormal
-from reliapy.distributions.continuous._tukeylambda import TukeyLambda
-from reliapy.distributions.continuous._uniform import Uniform
-from reliapy.distributions.continuous._vonmises import VonMises
-from reliapy.distributions.continuous._vonmises_line import VonMisesLine
-from reliapy.distributions.continuous._wald import Wald
-from reliapy.distributions.continuous._weibull_max import WeibullMax
-from reliapy.distributions.continuous._weibull_min import WeibullMin
-from reliapy.distributions.continuous._wrapcauchy import WrapCauchy
+from importlib import import_module
 
+# Module where each distribution is implemented.
+_DISTRIBUTIONS = {
+    '_Continuous': '_continuous',
+    'Normal': '_normal',
+    'Alpha': '_alpha',
+    'Anglit': '_anglit',
+    'ArcSine': '_arcsine',
+    'Argus': '_argus',
+    'Beta': '_beta',
+    'BetaPrime': '_betaprime',
+    'Bradford': '_bradford',
+    'Burr': '_burr',
+    'Burr12': '_burr12',
+    'Cauchy': '_cauchy',
+    'Chi': '_chi',
+    'Chi2': '_chi2',
+    'Cosine': '_cosine',
+    'Crystalball': '_crystalball',
+    'DGamma': '_dgamma',
+    'DWeibull': '_dweibull',
+    'Erlang': '_erlang',
+    'Expon': '_expon',
+    'ExponNorm': '_exponnorm',
+    'ExponPow': '_exponpow',
+    'ExponWeib': '_exponweib',
+    'F': '_f',
+    'FatigueLife': '_fatiguelife',
+    'Fisk': '_fisk',
+    'FoldCauchy': '_foldcauchy',
+    'FoldNorm': '_foldnorm',
+    'GenLogistic': '_genlogistic',
+    'GenNorm': '_gennorm',
+    'GenPareto': '_genpareto',
+    'Gamma': '_gamma',
+    'GaussHyper': '_gausshyper',
+    'GenExpon': '_genexpon',
+    'GenExtreme': '_genextreme',
+    'GenGamma': '_gengamma',
+    'GenHalfLogistic': '_genhalflogistic',
+    'GenHyperbolic': '_genhyperbolic',
+    'GenInvGauss': '_geninvgauss',
+    'Gilbrat': '_gilbrat',
+    'Gompertz': '_gompertz',
+    'Gumbel_L': '_gumbel_l',
+    'Gumbel_R': '_gumbel_r',
+    'HalfCauchy': '_halfcauchy',
+    'HalfGenNorm': '_halfgennorm',
+    'HalfLogistic': '_halflogistic',
+    'HalfNorm': '_halfnorm',
+    'HypSecant': '_hypsecant',
+    'InvGamma': '_invgamma',
+    'InvGauss': '_invgauss',
+    'InvWeibull': '_invweibull',
+    'JohnsonsB': '_johnsonsb',
+    'JohnsonsU': '_johnsonsu',
+    'Kappa3': '_kappa3',
+    'Kappa4': '_kappa4',
+    'KSone': '_ksone',
+    'KStwo': '_kstwo',
+    'KStwoBign': '_kstwobign',
+    'Laplace': '_laplace',
+    'LaplaceAsymmetric': '_laplace_asymmetric',
+    'Levy': '_levy',
+    'Levy_L': '_levy_l',
+    'LevyStable': '_levy_stable',
+    'LogGamma': '_loggamma',
+    'Logistic': '_logistic',
+    'LogLaplace': '_loglaplace',
+    'LogNormal': '_lognormal',
+    'LogUniform': '_loguniform',
+    'Lomax': '_lomax',
+    'Maxwell': '_maxwell',
+    'Mielke': '_mielke',
+    'Moyal': '_moyal',
+    'Nakagami': '_nakagami',
+    'NCF': '_ncf',
+    'NCT': '_nct',
+    'NCX2': '_ncx2',
+    'NormInvGauss': '_norminvgauss',
+    'Pareto': '_pareto',
+    'Pearson3': '_pearson3',
+    'PowerLaw': '_powerlaw',
+    'PowerLogNormal': '_powerlognormal',
+    'Rayleigh': '_rayleigh',
+    'RDist': '_rdist',
+    'RecipInvGauss': '_recipinvgauss',
+    'Rice': '_rice',
+    'SemiCircular': '_semicircular',
+    'SkewCauchy': '_skewcauchy',
+    'SkewNormal': '_skewnormal',
+    'StudentizedRange': '_studentized_range',
+    'T': '_t',
+    'Trapezoid': '_trapezoid',
+    'Triang': '_triang',
+    'TruncExpon': '_truncexpon',
+    'TruncNormal': '_truncnormal',
+    'TukeyLambda': '_tukeylambda',
+    'Uniform': '_uniform',
+    'VonMises': '_vonmises',
+    'VonMisesLine': '_vonmises_line',
+    'Wald': '_wald',
+    'WeibullMax': '_weibull_max',
+    'WeibullMin': '_weibull_min',
+    'WrapCauchy': '_wrapcauchy',
+}
 
-from reliapy.distributions.continuous._continuous import *
-from reliapy.distributions.continuous._normal import *
+__all__ = [name for name in _DISTRIBUTIONS if not name.startswith('_')]
 
+
+def __getattr__(name):
+    if name not in _DISTRIBUTIONS:
+        raise AttributeError('module ' + __name__ + ' has no attribute ' + name)
+
+    value = getattr(import_module(__name__ + '.' + _DISTRIBUTIONS[name]), name)
+    globals()[name] = value
+
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_DISTRIBUTIONS))
@@ -1,3 +1,7 @@
+import numpy as np
+from scipy.special import ndtr, ndtri, log_ndtr
+from scipy.interpolate import CubicHermiteSpline
+from scipy.stats import norm
 from reliapy._messages import *
 
 
@@ -15,6 +19,12 @@ class _Continuous:
      * **random_state** (`float`, `int`)
         Random seed for the random number generator.
 
+    * **prob** (`object`)
+        Distribution object from scipy.stats implementing the random variable (passed by the child classes).
+
+    * **params** (`dict`)
+        Shape, location and scale parameters of `prob` (passed by the child classes).
+
     **Attributes:**
 
     * **loc** (`float`)
@@ -29,10 +39,179 @@ class _Continuous:
     * **central_moments** (`ndarray`)
         Array with central moments.
 
+    * **stats** (`tuple`)
+        Mean and variance of the random variable, computed on first access.
+
+    * **mean** (`float`)
+        Mean of the random variable.
+
+    * **std** (`float`)
+        Standard deviation of the random variable.
+
     """
 
-    def __init__(self):
-        pass
+    # Child classes implementing their methods in closed form (without the frozen scipy.stats distribution) set it to
+    # `True`, since they gain nothing from `tabulate`.
+    _closed_form = False
+
+    # Parameters that must be positive. The child classes implemented in closed form check them, since they do not go
+    # through the argument check of scipy.stats (which would return nan).
+    _positive = ()
+
+    def __init__(self, prob=None, params=None):
+        self._prob = prob
+        self._params = {} if params is None else params
+
+        # Freeze the scipy.stats distribution once, so that all the methods of the child classes share it.
+        self._frozen = None if prob is None else prob(**self._params)
+        self._tabulated = False
+
+        # The moments are computed on first access, since they require numerical integration for some distributions
+        # (unless a child class already set them).
+        if not hasattr(self, '_stats'):
+            self._stats = None
+
+        self._check_params()
+
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+
+        # A parameter set after the initialization (e.g., `scale`) is copied to `params`, and the frozen distribution
+        # and the moments are rebuilt, so that all the methods keep using the same parameters. The table built by
+        # `tabulate` is discarded.
+        if name in self.__dict__.get('_params', {}):
+            self._params[name] = value
+            self._frozen = None if self._prob is None else self._prob(**self._params)
+            self._tabulated = False
+            self._stats = None
+            self._check_params()
+
+    def _check_params(self):
+        """
+        Private method checking the parameters listed in `_positive` (the ones that are not set yet are skipped).
+        """
+
+        for name in self._positive:
+            value = self._params.get(name)
+            if value is not None and not value > 0:
+                value_error(name)
+
+    @property
+    def stats(self):
+        if self._stats is None:
+            if self._frozen is None:
+                template_error()
+
+            self._stats = self._frozen.stats(moments='mv')
+
+        return self._stats
+
+    @stats.setter
+    def stats(self, stats):
+        self._stats = stats
+
+    @property
+    def mean(self):
+        return self.stats[0]
+
+    @property
+    def std(self):
+        return np.sqrt(self.stats[1])
+
+    def tabulate(self, tol=1e-4, z_max=8.0, n_points=65, max_iter=10):
+        """
+        Replace `cdf`, `icdf`, `sf`, `isf`, `logcdf`, `logsf` and `rvs` by interpolation on a table of the quantile
+        function. It is intended for distributions whose quantile function is computed by numerical root-finding (e.g.,
+        `LevyStable`), trading a controlled interpolation error for speed.
+
+        The quantile function is tabulated as a function of the standard normal variable `z = phi_icdf(y)`, so that
+        a uniform grid in `z` is refined towards the tails in probability. A monotone cubic Hermite spline is fitted,
+        with the exact slopes `dx/dz = phi_pdf(z) / pdf(x)` limited as in Fritsch and Carlson (1980). The intervals
+        where the spline differs from the exact quantile by more than the tolerance are subdivided until the tolerance
+        is satisfied or `max_iter` is reached. The error is checked at the thirds of each interval while refining, and
+        then at the eighths of each interval, so the tolerance is verified at these points only and may be slightly
+        exceeded between them. Probabilities beyond the table use the exact scipy.stats distribution.
+
+        The distributions implemented in closed form (`Normal`, `LogNormal`, `Gumbel_R`, `Gumbel_L`, `WeibullMin`,
+        `Expon` and `Uniform`) do not support it, since their quantile function is already exact and fast.
+
+        **Input:**
+        * **tol** (`float`)
+            Error bound for the quantile, relative to `max(1, |x|)`.
+
+        * **z_max** (`float`)
+            Bound of the table in the standard normal space, i.e., it covers `phi_cdf(-z_max) < y < phi_cdf(z_max)`.
+
+        * **n_points** (`int`)
+            Number of points of the initial table.
+
+        * **max_iter** (`int`)
+            Maximum number of refinement iterations. The tolerance may not be satisfied if it is reached.
+
+        **Output**
+            The distribution object itself.
+        """
+
+        if self._prob is None or self._closed_form:
+            not_implemented_error()
+
+        if tol <= 0:
+            value_error('tol')
+
+        if z_max <= 0:
+            value_error('z_max')
+
+        if not isinstance(n_points, int) or n_points < 2:
+            value_error('n_points')
+
+        exact = self._prob(**self._params)
+        z = np.linspace(-z_max, z_max, n_points)
+        x = _exact_ppf(exact, z)
+
+        # Points where the exact quantile could not be computed are left out of the table.
+        valid = np.isfinite(x)
+        z = z[valid]
+        x = x[valid]
+        if len(z) < 2:
+            value_error('z_max')
+
+        dx = _exact_slope(exact, z, x)
+
+        # The spline is checked at the thirds of each interval while it is refined (the error of a cubic Hermite
+        # interpolant may vanish at the midpoint), and then at the eighths of each interval, to verify the tolerance
+        # between the points checked so far. All the points checked in the intervals exceeding the tolerance are
+        # inserted.
+        fractions = _THIRDS
+        itera = 0
+        while itera < max_iter:
+            spline = _monotone_spline(z, x, dx)
+            z_new = np.concatenate([(1 - f) * z[:-1] + f * z[1:] for f in fractions])
+            x_new = _exact_ppf(exact, z_new)
+            with np.errstate(invalid='ignore'):
+                error = np.abs(spline(z_new) - x_new) > tol * np.maximum(1, np.abs(x_new))
+
+            refine = np.tile(np.any(error.reshape(len(fractions), -1), axis=0), len(fractions)) & np.isfinite(x_new)
+            if not np.any(refine):
+                if fractions is _EIGHTHS:
+                    break
+
+                fractions = _EIGHTHS
+                continue
+
+            z = np.concatenate((z, z_new[refine]))
+            x = np.concatenate((x, x_new[refine]))
+            dx = np.concatenate((dx, _exact_slope(exact, z_new[refine], x_new[refine])))
+            order = np.argsort(z)
+            z = z[order]
+            x = x[order]
+            dx = dx[order]
+            fractions = _THIRDS
+            itera = itera + 1
+
+        self._frozen = _Tabulated(exact, z, x, dx)
+        self._tabulated = True
+
+        return self
 
     def pdf(self, X=None):
         template_error()
@@ -43,8 +222,155 @@ class _Continuous:
     def icdf(self, X=None):
         template_error()
 
+    # The following methods default to the ones above, so that child classes only implementing `pdf`, `cdf` and
+    # `icdf` keep working; the child classes override them with tail-accurate implementations.
+    def sf(self, X=None):
+        return 1 - self.cdf(X)
+
+    def isf(self, y=None):
+        return self.icdf(1 - np.asarray(y, dtype=float))
+
+    def logpdf(self, X=None):
+        with np.errstate(divide='ignore'):
+            return np.log(self.pdf(X))
+
+    def logcdf(self, X=None):
+        with np.errstate(divide='ignore'):
+            return np.log(self.cdf(X))
+
+    def logsf(self, X=None):
+        with np.errstate(divide='ignore'):
+            return np.log(self.sf(X))
+
     def moment(self, n=1):
         template_error()
 
     def rvs(self, n_sim=1):
         template_error()
+
+
+# Fractions of the intervals of the table where `tabulate` checks the spline.
+_THIRDS = (1 / 3, 2 / 3)
+_EIGHTHS = tuple(np.arange(1, 8) / 8)
+
+
+def _log1mexp(t):
+    # log(1 - exp(-t)) for t >= 0, using log(-expm1(-t)) for small t and log1p(-exp(-t)) for large t, so that it is
+    # accurate in both tails (Maechler, 2012).
+    t = np.asarray(t, dtype=float)
+    with np.errstate(divide='ignore'):
+        return np.where(t > np.log(2), np.log1p(-np.exp(-t)), np.log(-np.expm1(-t)))
+
+
+def _exact_ppf(exact, z):
+    # Exact quantiles for the table at the standard normal values z, one at a time, so that a failure of the numerical
+    # root-finding in scipy.stats only discards that point. The upper tail uses the inverse survival function, since
+    # phi_cdf(z) rounds to 1 there.
+    x = np.empty(len(z))
+    for i in range(len(z)):
+        try:
+            if z[i] > 0:
+                x[i] = exact.isf(ndtr(-z[i]))
+            else:
+                x[i] = exact.ppf(ndtr(z[i]))
+        except (RuntimeError, ValueError):
+            x[i] = np.nan
+
+    return x
+
+
+def _exact_slope(exact, z, x):
+    # Slope dx/dz of the quantile function in the standard normal space.
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return norm.pdf(z) / exact.pdf(x)
+
+
+def _monotone_spline(t, v, dv):
+    # Cubic Hermite spline through (t, v) with slopes dv, where the slopes are limited to [0, 3 * secant] on both
+    # sides of each knot, which is sufficient for a monotone spline (Fritsch and Carlson, 1980).
+    secant = np.diff(v) / np.diff(t)
+    bound = 3 * np.minimum(np.concatenate((secant[:1], secant)), np.concatenate((secant, secant[-1:])))
+    dv = np.clip(np.where(np.isnan(dv), np.inf, dv), 0, bound)
+
+    return CubicHermiteSpline(t, v, dv, extrapolate=False)
+
+
+class _Tabulated:
+    """
+    Drop-in replacement for a frozen scipy.stats distribution, whose `cdf`, `ppf`, `sf`, `isf`, `logcdf`, `logsf` and
+    `rvs` interpolate a table of the quantile function built by ``_Continuous.tabulate``. The other methods use the
+    exact distribution.
+    """
+
+    def __init__(self, exact, z, x, dx):
+        self.exact = exact
+
+        # Numerical noise of the exact quantile may break the monotonicity of the table, and the inverse spline needs
+        # strictly increasing knots in x (flat parts arise at the bounds of the support).
+        keep = x >= np.maximum.accumulate(x)
+        self.z = z[keep]
+        self.x = x[keep]
+        self.dx = dx[keep]
+        self.quantile = _monotone_spline(self.z, self.x, self.dx)
+
+        strict = np.concatenate(([True], np.diff(self.x) > 0))
+        with np.errstate(divide='ignore'):
+            self.inverse = _monotone_spline(self.x[strict], self.z[strict], 1 / self.dx[strict])
+
+    def __getattr__(self, name):
+        # Guard against the lookups made before __init__ (e.g., when unpickling).
+        if name == 'exact':
+            raise AttributeError(name)
+
+        return getattr(self.exact, name)
+
+    def ppf(self, q):
+        q = np.asarray(q, dtype=float)
+        return self._quantile(ndtri(q.ravel()), self.exact.ppf, q)
+
+    def isf(self, q):
+        q = np.asarray(q, dtype=float)
+        return self._quantile(-ndtri(q.ravel()), self.exact.isf, q)
+
+    def cdf(self, x):
+        return self._probability(x, ndtr, 1, self.exact.cdf)
+
+    def sf(self, x):
+        return self._probability(x, ndtr, -1, self.exact.sf)
+
+    def logcdf(self, x):
+        return self._probability(x, log_ndtr, 1, self.exact.logcdf)
+
+    def logsf(self, x):
+        return self._probability(x, log_ndtr, -1, self.exact.logsf)
+
+    def _quantile(self, z, fallback, q):
+        # Quantiles at the standard normal values z, using the exact distribution beyond the table.
+        x = self.quantile(z)
+        outside = np.isnan(x)
+        if np.any(outside):
+            x[outside] = fallback(q.ravel()[outside])
+
+        return x.reshape(q.shape)[()]
+
+    def _probability(self, x, fun, sign, fallback):
+        # fun(sign * z), where z is the standard normal value of x, using the exact distribution beyond the table.
+        x = np.asarray(x, dtype=float)
+        x_flat = x.ravel()
+        z = self.inverse(x_flat)
+        y = fun(sign * z)
+        outside = np.isnan(z)
+        if np.any(outside):
+            y[outside] = fallback(x_flat[outside])
+
+        return y.reshape(x.shape)[()]
+
+    def rvs(self, size=None, random_state=None):
+        z = np.asarray(norm.rvs(size=size, random_state=random_state), dtype=float)
+        z_flat = z.ravel()
+        x = self.quantile(z_flat)
+        outside = np.isnan(x)
+        if np.any(outside):
+            x[outside] = self.exact.ppf(ndtr(z_flat[outside]))
+
+        return x.reshape(z.shape)[()]
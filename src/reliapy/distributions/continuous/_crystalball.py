@@ -9,10 +9,9 @@ class Crystalball(_Continuous):
         self.m = m
         self.loc = loc
         self.scale = scale
-        self.stats = prob.stats(beta=self.beta, m=self.m, loc=self.loc, scale=self.scale, moments='mv')
         self.random_state = random_state
 
-        super().__init__()
+        super().__init__(prob=prob, params=dict(beta=self.beta, m=self.m, loc=self.loc, scale=self.scale))
 
     def pdf(self, X=None):
         """
@@ -25,7 +24,7 @@ class Crystalball(_Continuous):
         **Output**
             PDF of X.
         """
-        return prob.pdf(X, beta=self.beta, m=self.m, loc=self.loc, scale=self.scale)
+        return self._frozen.pdf(X)
 
     def cdf(self, X=None):
         """
@@ -38,7 +37,7 @@ class Crystalball(_Continuous):
         **Output**
             CDF of X.
         """
-        return prob.cdf(X, beta=self.beta, m=self.m, loc=self.loc, scale=self.scale)
+        return self._frozen.cdf(X)
 
     def icdf(self, y=None):
         """
@@ -51,7 +50,72 @@ class Crystalball(_Continuous):
         **Output**
             Inverse CDF of X.
         """
-        return prob.ppf(y, beta=self.beta, m=self.m, loc=self.loc, scale=self.scale)
+        return self._frozen.ppf(y)
+
+    def sf(self, X=None):
+        """
+        Survival function (1 - CDF).
+
+        **Input:**
+        * **X** (`float`)
+            Argument.
+
+        **Output**
+            Survival function of X.
+        """
+        return self._frozen.sf(X)
+
+    def isf(self, y=None):
+        """
+        Inverse survival function.
+
+        **Input:**
+        * **y** (`float`)
+            Probability.
+
+        **Output**
+            Inverse survival function of y.
+        """
+        return self._frozen.isf(y)
+
+    def logpdf(self, X=None):
+        """
+        Logarithm of the PDF.
+
+        **Input:**
+        * **X** (`float`)
+            Argument.
+
+        **Output**
+            Logarithm of the PDF of X.
+        """
+        return self._frozen.logpdf(X)
+
+    def logcdf(self, X=None):
+        """
+        Logarithm of the CDF.
+
+        **Input:**
+        * **X** (`float`)
+            Argument.
+
+        **Output**
+            Logarithm of the CDF of X.
+        """
+        return self._frozen.logcdf(X)
+
+    def logsf(self, X=None):
+        """
+        Logarithm of the survival function.
+
+        **Input:**
+        * **X** (`float`)
+            Argument.
+
+        **Output**
+            Logarithm of the survival function of X.
+        """
+        return self._frozen.logsf(X)
 
     def moment(self, n=1):
         """
@@ -64,7 +128,7 @@ class Crystalball(_Continuous):
         **Output**
             non central moment.
         """
-        return prob.moment(n, beta=self.beta, m=self.m, loc=self.loc, scale=self.scale)
+        return self._frozen.moment(n)
 
     def rvs(self, n_sim=1):
         """
@@ -77,4 +141,4 @@ class Crystalball(_Continuous):
         **Output**
             Samples.
         """
-        return prob.rvs(beta=self.beta, m=self.m, loc=self.loc, scale=self.scale, size=n_sim, random_state=self.random_state)
+        return self._frozen.rvs(size=n_sim, random_state=self.random_state)
@@ -1,16 +1,20 @@
+import numpy as np
 from reliapy.distributions.continuous import _Continuous
+from reliapy.distributions.continuous._continuous import _log1mexp
 from scipy.stats import gumbel_l as prob
 
 
 class Gumbel_L(_Continuous):
 
+    _closed_form = True
+    _positive = ('scale',)
+
     def __init__(self, loc=None, scale=None, random_state=None):
         self.loc = loc
         self.scale = scale
-        self.stats = prob.stats(loc=self.loc, scale=self.scale, moments='mv')
         self.random_state = random_state
 
-        super().__init__()
+        super().__init__(prob=prob, params=dict(loc=self.loc, scale=self.scale))
 
     def pdf(self, X=None):
         """
@@ -23,7 +27,9 @@ class Gumbel_L(_Continuous):
         **Output**
             PDF of X.
         """
-        return prob.pdf(X, loc=self.loc, scale=self.scale)
+        z = (np.asarray(X, dtype=float) - self.loc) / self.scale
+        with np.errstate(over='ignore'):
+            return (np.exp(z - np.exp(z)) / self.scale)[()]
 
     def cdf(self, X=None):
         """
@@ -36,7 +42,9 @@ class Gumbel_L(_Continuous):
         **Output**
             CDF of X.
         """
-        return prob.cdf(X, loc=self.loc, scale=self.scale)
+        z = (np.asarray(X, dtype=float) - self.loc) / self.scale
+        with np.errstate(over='ignore'):
+            return -np.expm1(-np.exp(z))[()]
 
     def icdf(self, y=None):
         """
@@ -49,7 +57,84 @@ class Gumbel_L(_Continuous):
         **Output**
             Inverse CDF of X.
         """
-        return prob.ppf(y, loc=self.loc, scale=self.scale)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return (self.loc + self.scale * np.log(-np.log1p(-np.asarray(y, dtype=float))))[()]
+
+    def sf(self, X=None):
+        """
+        Survival function (1 - CDF).
+
+        **Input:**
+        * **X** (`float`)
+            Argument.
+
+        **Output**
+            Survival function of X.
+        """
+        z = (np.asarray(X, dtype=float) - self.loc) / self.scale
+        with np.errstate(over='ignore'):
+            return np.exp(-np.exp(z))[()]
+
+    def isf(self, y=None):
+        """
+        Inverse survival function.
+
+        **Input:**
+        * **y** (`float`)
+            Probability.
+
+        **Output**
+            Inverse survival function of y.
+        """
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return (self.loc + self.scale * np.log(-np.log(np.asarray(y, dtype=float))))[()]
+
+    def logpdf(self, X=None):
+        """
+        Logarithm of the PDF.
+
+        **Input:**
+        * **X** (`float`)
+            Argument.
+
+        **Output**
+            Logarithm of the PDF of X.
+        """
+        z = (np.asarray(X, dtype=float) - self.loc) / self.scale
+        with np.errstate(over='ignore'):
+            return (z - np.exp(z) - np.log(self.scale))[()]
+
+    def logcdf(self, X=None):
+        """
+        Logarithm of the CDF.
+
+        **Input:**
+        * **X** (`float`)
+            Argument.
+
+        **Output**
+            Logarithm of the CDF of X.
+        """
+        z = (np.asarray(X, dtype=float) - self.loc) / self.scale
+        with np.errstate(over='ignore', divide='ignore'):
+            e = np.exp(z)
+            # log(1 - exp(-e)) ~ z - e / 2 when e is small (lower tail).
+            return np.where(e > 1e-8, _log1mexp(e), z - e / 2)[()]
+
+    def logsf(self, X=None):
+        """
+        Logarithm of the survival function.
+
+        **Input:**
+        * **X** (`float`)
+            Argument.
+
+        **Output**
+            Logarithm of the survival function of X.
+        """
+        z = (np.asarray(X, dtype=float) - self.loc) / self.scale
+        with np.errstate(over='ignore'):
+            return -np.exp(z)[()]
 
     def moment(self, n=1):
         """
@@ -62,7 +147,7 @@ class Gumbel_L(_Continuous):
         **Output**
             non central moment.
         """
-        return prob.moment(n, loc=self.loc, scale=self.scale)
+        return self._frozen.moment(n)
 
     def rvs(self, n_sim=1):
         """
@@ -75,4 +160,4 @@ class Gumbel_L(_Continuous):
         **Output**
             Samples.
         """
-        return prob.rvs(loc=self.loc, scale=self.scale, size=n_sim, random_state=self.random_state)
+        return self._frozen.rvs(size=n_sim, random_state=self.random_state)
@@ -1,17 +1,21 @@
+import numpy as np
+from scipy.special import ndtr, ndtri, log_ndtr
 from reliapy.distributions.continuous import _Continuous
 from scipy.stats import lognorm as prob
 
 
 class LogNormal(_Continuous):
 
+    _closed_form = True
+    _positive = ('s', 'scale')
+
     def __init__(self, s=None, loc=None, scale=None, random_state=None):
         self.s = s
         self.loc = loc
         self.scale = scale
-        self.stats = prob.stats(s=self.s, loc=self.loc, scale=self.scale, moments='mv')
         self.random_state = random_state
 
-        super().__init__()
+        super().__init__(prob=prob, params=dict(s=self.s, loc=self.loc, scale=self.scale))
 
     def pdf(self, X=None):
         """
@@ -24,7 +28,11 @@ class LogNormal(_Continuous):
         **Output**
             PDF of X.
         """
-        return prob.pdf(X, s=self.s, loc=self.loc, scale=self.scale)
+        t = (np.asarray(X, dtype=float) - self.loc) / self.scale
+        with np.errstate(divide='ignore', invalid='ignore'):
+            log_t = np.log(np.where(t <= 0, 1.0, t))
+            f = np.exp(-0.5 * (log_t / self.s) ** 2) / (self.s * t * np.sqrt(2 * np.pi) * self.scale)
+        return np.where(t <= 0, 0.0, f)[()]
 
     def cdf(self, X=None):
         """
@@ -37,7 +45,9 @@ class LogNormal(_Continuous):
         **Output**
             CDF of X.
         """
-        return prob.cdf(X, s=self.s, loc=self.loc, scale=self.scale)
+        t = (np.asarray(X, dtype=float) - self.loc) / self.scale
+        log_t = np.log(np.where(t <= 0, 1.0, t))
+        return np.where(t <= 0, 0.0, ndtr(log_t / self.s))[()]
 
     def icdf(self, y=None):
         """
@@ -50,7 +60,81 @@ class LogNormal(_Continuous):
         **Output**
             Inverse CDF of X.
         """
-        return prob.ppf(y, s=self.s, loc=self.loc, scale=self.scale)
+        return (self.loc + self.scale * np.exp(self.s * ndtri(np.asarray(y, dtype=float))))[()]
+
+    def sf(self, X=None):
+        """
+        Survival function (1 - CDF).
+
+        **Input:**
+        * **X** (`float`)
+            Argument.
+
+        **Output**
+            Survival function of X.
+        """
+        t = (np.asarray(X, dtype=float) - self.loc) / self.scale
+        log_t = np.log(np.where(t <= 0, 1.0, t))
+        return np.where(t <= 0, 1.0, ndtr(-log_t / self.s))[()]
+
+    def isf(self, y=None):
+        """
+        Inverse survival function.
+
+        **Input:**
+        * **y** (`float`)
+            Probability.
+
+        **Output**
+            Inverse survival function of y.
+        """
+        return (self.loc + self.scale * np.exp(-self.s * ndtri(np.asarray(y, dtype=float))))[()]
+
+    def logpdf(self, X=None):
+        """
+        Logarithm of the PDF.
+
+        **Input:**
+        * **X** (`float`)
+            Argument.
+
+        **Output**
+            Logarithm of the PDF of X.
+        """
+        t = (np.asarray(X, dtype=float) - self.loc) / self.scale
+        log_t = np.log(np.where(t <= 0, 1.0, t))
+        f = -0.5 * (log_t / self.s) ** 2 - log_t - np.log(self.s * np.sqrt(2 * np.pi) * self.scale)
+        return np.where(t <= 0, -np.inf, f)[()]
+
+    def logcdf(self, X=None):
+        """
+        Logarithm of the CDF.
+
+        **Input:**
+        * **X** (`float`)
+            Argument.
+
+        **Output**
+            Logarithm of the CDF of X.
+        """
+        t = (np.asarray(X, dtype=float) - self.loc) / self.scale
+        log_t = np.log(np.where(t <= 0, 1.0, t))
+        return np.where(t <= 0, -np.inf, log_ndtr(log_t / self.s))[()]
+
+    def logsf(self, X=None):
+        """
+        Logarithm of the survival function.
+
+        **Input:**
+        * **X** (`float`)
+            Argument.
+
+        **Output**
+            Logarithm of the survival function of X.
+        """
+        t = (np.asarray(X, dtype=float) - self.loc) / self.scale
+        log_t = np.log(np.where(t <= 0, 1.0, t))
+        return np.where(t <= 0, 0.0, log_ndtr(-log_t / self.s))[()]
 
     def moment(self, n=1):
         """
@@ -63,7 +147,7 @@ class LogNormal(_Continuous):
         **Output**
             non central moment.
         """
-        return prob.moment(n, s=self.s, loc=self.loc, scale=self.scale)
+        return self._frozen.moment(n)
 
     def rvs(self, n_sim=1):
         """
@@ -76,4 +160,4 @@ class LogNormal(_Continuous):
         **Output**
             Samples.
         """
-        return prob.rvs(s=self.s, loc=self.loc, scale=self.scale, size=n_sim, random_state=self.random_state)
+        return self._frozen.rvs(size=n_sim, random_state=self.random_state)
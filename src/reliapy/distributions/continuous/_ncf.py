@@ -10,10 +10,9 @@ class NCF(_Continuous):
         self.nc = nc
         self.loc = loc
         self.scale = scale
-        self.stats = prob.stats(dfn=self.dfn, dfd=self.dfd, nc=self.nc, loc=self.loc, scale=self.scale, moments='mv')
         self.random_state = random_state
 
-        super().__init__()
+        super().__init__(prob=prob, params=dict(dfn=self.dfn, dfd=self.dfd, nc=self.nc, loc=self.loc, scale=self.scale))
 
     def pdf(self, X=None):
         """
@@ -26,7 +25,7 @@ class NCF(_Continuous):
         **Output**
             PDF of X.
         """
-        return prob.pdf(X, dfn=self.dfn, dfd=self.dfd, nc=self.nc, loc=self.loc, scale=self.scale)
+        return self._frozen.pdf(X)
 
     def cdf(self, X=None):
         """
@@ -39,7 +38,7 @@ class NCF(_Continuous):
         **Output**
             CDF of X.
         """
-        return prob.cdf(X, dfn=self.dfn, dfd=self.dfd, nc=self.nc, loc=self.loc, scale=self.scale)
+        return self._frozen.cdf(X)
 
     def icdf(self, y=None):
         """
@@ -52,7 +51,72 @@ class NCF(_Continuous):
         **Output**
             Inverse CDF of X.
         """
-        return prob.ppf(y, dfn=self.dfn, dfd=self.dfd, nc=self.nc, loc=self.loc, scale=self.scale)
+        return self._frozen.ppf(y)
+
+    def sf(self, X=None):
+        """
+        Survival function (1 - CDF).
+
+        **Input:**
+        * **X** (`float`)
+            Argument.
+
+        **Output**
+            Survival function of X.
+        """
+        return self._frozen.sf(X)
+
+    def isf(self, y=None):
+        """
+        Inverse survival function.
+
+        **Input:**
+        * **y** (`float`)
+            Probability.
+
+        **Output**
+            Inverse survival function of y.
+        """
+        return self._frozen.isf(y)
+
+    def logpdf(self, X=None):
+        """
+        Logarithm of the PDF.
+
+        **Input:**
+        * **X** (`float`)
+            Argument.
+
+        **Output**
+            Logarithm of the PDF of X.
+        """
+        return self._frozen.logpdf(X)
+
+    def logcdf(self, X=None):
+        """
+        Logarithm of the CDF.
+
+        **Input:**
+        * **X** (`float`)
+            Argument.
+
+        **Output**
+            Logarithm of the CDF of X.
+        """
+        return self._frozen.logcdf(X)
+
+    def logsf(self, X=None):
+        """
+        Logarithm of the survival function.
+
+        **Input:**
+        * **X** (`float`)
+            Argument.
+
+        **Output**
+            Logarithm of the survival function of X.
+        """
+        return self._frozen.logsf(X)
 
     def moment(self, n=1):
         """
@@ -65,7 +129,7 @@ class NCF(_Continuous):
         **Output**
             non central moment.
         """
-        return prob.moment(n, dfn=self.dfn, dfd=self.dfd, nc=self.nc, loc=self.loc, scale=self.scale)
+        return self._frozen.moment(n)
 
     def rvs(self, n_sim=1):
         """
@@ -78,4 +142,4 @@ class NCF(_Continuous):
         **Output**
             Samples.
         """
-        return prob.rvs(dfn=self.dfn, dfd=self.dfd, nc=self.nc, loc=self.loc, scale=self.scale, size=n_sim, random_state=self.random_state)
+        return self._frozen.rvs(size=n_sim, random_state=self.random_state)
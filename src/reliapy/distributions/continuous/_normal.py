@@ -1,16 +1,20 @@
+import numpy as np
+from scipy.special import ndtr, ndtri, log_ndtr
 from reliapy.distributions.continuous import _Continuous
 from scipy.stats import norm as prob
 
 
 class Normal(_Continuous):
 
+    _closed_form = True
+    _positive = ('scale',)
+
     def __init__(self, loc=None, scale=None, random_state=None):
         self.loc = loc
         self.scale = scale
-        self.stats = prob.stats(loc=self.loc, scale=self.scale, moments='mv')
         self.random_state = random_state
 
-        super().__init__()
+        super().__init__(prob=prob, params=dict(loc=self.loc, scale=self.scale))
 
     def pdf(self, X=None):
         """
@@ -23,7 +27,8 @@ class Normal(_Continuous):
         **Output**
             PDF of X.
         """
-        return prob.pdf(X, loc=self.loc, scale=self.scale)
+        z = (np.asarray(X, dtype=float) - self.loc) / self.scale
+        return (np.exp(-0.5 * z ** 2) / (np.sqrt(2 * np.pi) * self.scale))[()]
 
     def cdf(self, X=None):
         """
@@ -36,7 +41,8 @@ class Normal(_Continuous):
         **Output**
             CDF of X.
         """
-        return prob.cdf(X, loc=self.loc, scale=self.scale)
+        z = (np.asarray(X, dtype=float) - self.loc) / self.scale
+        return ndtr(z)[()]
 
     def icdf(self, y=None):
         """
@@ -49,7 +55,76 @@ class Normal(_Continuous):
         **Output**
             Inverse CDF of X.
         """
-        return prob.ppf(y, loc=self.loc, scale=self.scale)
+        return (self.loc + self.scale * ndtri(np.asarray(y, dtype=float)))[()]
+
+    def sf(self, X=None):
+        """
+        Survival function (1 - CDF).
+
+        **Input:**
+        * **X** (`float`)
+            Argument.
+
+        **Output**
+            Survival function of X.
+        """
+        z = (np.asarray(X, dtype=float) - self.loc) / self.scale
+        return ndtr(-z)[()]
+
+    def isf(self, y=None):
+        """
+        Inverse survival function.
+
+        **Input:**
+        * **y** (`float`)
+            Probability.
+
+        **Output**
+            Inverse survival function of y.
+        """
+        return (self.loc - self.scale * ndtri(np.asarray(y, dtype=float)))[()]
+
+    def logpdf(self, X=None):
+        """
+        Logarithm of the PDF.
+
+        **Input:**
+        * **X** (`float`)
+            Argument.
+
+        **Output**
+            Logarithm of the PDF of X.
+        """
+        z = (np.asarray(X, dtype=float) - self.loc) / self.scale
+        return (-0.5 * z ** 2 - np.log(np.sqrt(2 * np.pi) * self.scale))[()]
+
+    def logcdf(self, X=None):
+        """
+        Logarithm of the CDF.
+
+        **Input:**
+        * **X** (`float`)
+            Argument.
+
+        **Output**
+            Logarithm of the CDF of X.
+        """
+        z = (np.asarray(X, dtype=float) - self.loc) / self.scale
+        return log_ndtr(z)[()]
+
+    def logsf(self, X=None):
+        """
+        Logarithm of the survival function.
+
+        **Input:**
+        * **X** (`float`)
+            Argument.
+
+        **Output**
+            Logarithm of the survival function of X.
+        """
+        z = (np.asarray(X, dtype=float) - self.loc) / self.scale
+        return log_ndtr(-z)[()]
 
     def moment(self, n=1):
         """
@@ -62,7 +137,7 @@ class Normal(_Continuous):
         **Output**
             non central moment.
         """
-        return prob.moment(n, loc=self.loc, scale=self.scale)
+        return self._frozen.moment(n)
 
     def rvs(self, n_sim=1):
         """
@@ -75,4 +150,4 @@ class Normal(_Continuous):
         **Output**
             Samples.
         """
-        return prob.rvs(loc=self.loc, scale=self.scale, size=n_sim, random_state=self.random_state)
+        return self._frozen.rvs(size=n_sim, random_state=self.random_state)
@@ -1,16 +1,19 @@
+import numpy as np
 from reliapy.distributions.continuous import _Continuous
 from scipy.stats import uniform as prob
 
 
 class Uniform(_Continuous):
 
+    _closed_form = True
+    _positive = ('scale',)
+
     def __init__(self, loc=None, scale=None, random_state=None):
         self.loc = loc
         self.scale = scale
-        self.stats = prob.stats(loc=self.loc, scale=self.scale, moments='mv')
         self.random_state = random_state
 
-        super().__init__()
+        super().__init__(prob=prob, params=dict(loc=self.loc, scale=self.scale))
 
     def pdf(self, X=None):
         """
@@ -23,7 +26,8 @@ class Uniform(_Continuous):
         **Output**
             PDF of X.
         """
-        return prob.pdf(X, loc=self.loc, scale=self.scale)
+        z = (np.asarray(X, dtype=float) - self.loc) / self.scale
+        return np.where((z < 0) | (z > 1), 0.0, np.where(np.isnan(z), np.nan, 1 / self.scale))[()]
 
     def cdf(self, X=None):
         """
@@ -36,7 +40,8 @@ class Uniform(_Continuous):
         **Output**
             CDF of X.
         """
-        return prob.cdf(X, loc=self.loc, scale=self.scale)
+        z = (np.asarray(X, dtype=float) - self.loc) / self.scale
+        return np.clip(z, 0, 1)[()]
 
     def icdf(self, y=None):
         """
@@ -49,7 +54,80 @@ class Uniform(_Continuous):
         **Output**
             Inverse CDF of X.
         """
-        return prob.ppf(y, loc=self.loc, scale=self.scale)
+        y = np.asarray(y, dtype=float)
+        return np.where((y >= 0) & (y <= 1), self.loc + self.scale * y, np.nan)[()]
+
+    def sf(self, X=None):
+        """
+        Survival function (1 - CDF).
+
+        **Input:**
+        * **X** (`float`)
+            Argument.
+
+        **Output**
+            Survival function of X.
+        """
+        z = (np.asarray(X, dtype=float) - self.loc) / self.scale
+        return np.clip(1 - z, 0, 1)[()]
+
+    def isf(self, y=None):
+        """
+        Inverse survival function.
+
+        **Input:**
+        * **y** (`float`)
+            Probability.
+
+        **Output**
+            Inverse survival function of y.
+        """
+        y = np.asarray(y, dtype=float)
+        return np.where((y >= 0) & (y <= 1), self.loc + self.scale * (1 - y), np.nan)[()]
+
+    def logpdf(self, X=None):
+        """
+        Logarithm of the PDF.
+
+        **Input:**
+        * **X** (`float`)
+            Argument.
+
+        **Output**
+            Logarithm of the PDF of X.
+        """
+        z = (np.asarray(X, dtype=float) - self.loc) / self.scale
+        return np.where((z < 0) | (z > 1), -np.inf, np.where(np.isnan(z), np.nan, -np.log(self.scale)))[()]
+
+    def logcdf(self, X=None):
+        """
+        Logarithm of the CDF.
+
+        **Input:**
+        * **X** (`float`)
+            Argument.
+
+        **Output**
+            Logarithm of the CDF of X.
+        """
+        z = (np.asarray(X, dtype=float) - self.loc) / self.scale
+        with np.errstate(divide='ignore'):
+            return np.log(np.clip(z, 0, 1))[()]
+
+    def logsf(self, X=None):
+        """
+        Logarithm of the survival function.
+
+        **Input:**
+        * **X** (`float`)
+            Argument.
+
+        **Output**
+            Logarithm of the survival function of X.
+        """
+        z = (np.asarray(X, dtype=float) - self.loc) / self.scale
+        with np.errstate(divide='ignore'):
+            return np.log(np.clip(1 - z, 0, 1))[()]
 
     def moment(self, n=1):
         """
@@ -62,7 +140,7 @@ class Uniform(_Continuous):
         **Output**
             non central moment.
         """
-        return prob.moment(n, loc=self.loc, scale=self.scale)
+        return self._frozen.moment(n)
 
     def rvs(self, n_sim=1):
         """
@@ -75,4 +153,4 @@ class Uniform(_Continuous):
         **Output**
             Samples.
         """
-        return prob.rvs(loc=self.loc, scale=self.scale, size=n_sim, random_state=self.random_state)
+        return self._frozen.rvs(size=n_sim, random_state=self.random_state)
@@ -8,10 +8,9 @@ class VonMisesLine(_Continuous):
         self.kappa = kappa
         self.loc = loc
         self.scale = scale
-        self.stats = prob.stats(kappa=self.kappa, loc=self.loc, scale=self.scale, moments='mv')
         self.random_state = random_state
 
-        super().__init__()
+        super().__init__(prob=prob, params=dict(kappa=self.kappa, loc=self.loc, scale=self.scale))
 
     def pdf(self, X=None):
         """
@@ -24,7 +23,7 @@ class VonMisesLine(_Continuous):
         **Output**
             PDF of X.
         """
-        return prob.pdf(X, kappa=self.kappa, loc=self.loc, scale=self.scale)
+        return self._frozen.pdf(X)
 
     def cdf(self, X=None):
         """
@@ -37,7 +36,7 @@ class VonMisesLine(_Continuous):
         **Output**
             CDF of X.
         """
-        return prob.cdf(X, kappa=self.kappa, loc=self.loc, scale=self.scale)
+        return self._frozen.cdf(X)
 
     def icdf(self, y=None):
         """
@@ -50,7 +49,72 @@ class VonMisesLine(_Continuous):
         **Output**
             Inverse CDF of X.
         """
-        return prob.ppf(y, kappa=self.kappa, loc=self.loc, scale=self.scale)
+        return self._frozen.ppf(y)
+
+    def sf(self, X=None):
+        """
+        Survival function (1 - CDF).
+
+        **Input:**
+        * **X** (`float`)
+            Argument.
+
+        **Output**
+            Survival function of X.
+        """
+        return self._frozen.sf(X)
+
+    def isf(self, y=None):
+        """
+        Inverse survival function.
+
+        **Input:**
+        * **y** (`float`)
+            Probability.
+
+        **Output**
+            Inverse survival function of y.
+        """
+        return self._frozen.isf(y)
+
+    def logpdf(self, X=None):
+        """
+        Logarithm of the PDF.
+
+        **Input:**
+        * **X** (`float`)
+            Argument.
+
+        **Output**
+            Logarithm of the PDF of X.
+        """
+        return self._frozen.logpdf(X)
+
+    def logcdf(self, X=None):
+        """
+        Logarithm of the CDF.
+
+        **Input:**
+        * **X** (`float`)
+            Argument.
+
+        **Output**
+            Logarithm of the CDF of X.
+        """
+        return self._frozen.logcdf(X)
+
+    def logsf(self, X=None):
+        """
+        Logarithm of the survival function.
+
+        **Input:**
+        * **X** (`float`)
+            Argument.
+
+        **Output**
+            Logarithm of the survival function of X.
+        """
+        return self._frozen.logsf(X)
 
     def moment(self, n=1):
         """
@@ -63,7 +127,7 @@ class VonMisesLine(_Continuous):
         **Output**
             non central moment.
         """
-        return prob.moment(n, kappa=self.kappa, loc=self.loc, scale=self.scale)
+        return self._frozen.moment(n)
 
     def rvs(self, n_sim=1):
         """
@@ -76,4 +140,4 @@ class VonMisesLine(_Continuous):
         **Output**
             Samples.
         """
-        return prob.rvs(kappa=self.kappa, loc=self.loc, scale=self.scale, size=n_sim, random_state=self.random_state)
\ No newline at end of file
+        return self._frozen.rvs(size=n_sim, random_state=self.random_state)
\ No newline at end of file
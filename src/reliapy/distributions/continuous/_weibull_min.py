@@ -1,17 +1,22 @@
+import numpy as np
+from scipy.special import xlogy
 from reliapy.distributions.continuous import _Continuous
+from reliapy.distributions.continuous._continuous import _log1mexp
 from scipy.stats import weibull_min as prob
 
 
 class WeibullMin(_Continuous):
 
+    _closed_form = True
+    _positive = ('c', 'scale')
+
     def __init__(self, c=None, loc=None, scale=None, random_state=None):
         self.c = c
         self.loc = loc
         self.scale = scale
-        self.stats = prob.stats(c=self.c, loc=self.loc, scale=self.scale, moments='mv')
         self.random_state = random_state
 
-        super().__init__()
+        super().__init__(prob=prob, params=dict(c=self.c, loc=self.loc, scale=self.scale))
 
     def pdf(self, X=None):
         """
@@ -24,7 +29,11 @@ class WeibullMin(_Continuous):
         **Output**
             PDF of X.
         """
-        return prob.pdf(X, c=self.c, loc=self.loc, scale=self.scale)
+        z = (np.asarray(X, dtype=float) - self.loc) / self.scale
+        with np.errstate(divide='ignore', invalid='ignore'):
+            z_pos = np.where(z < 0, 0.0, z)
+            f = self.c * z_pos ** (self.c - 1) * np.exp(-z_pos ** self.c) / self.scale
+        return np.where(z < 0, 0.0, f)[()]
 
     def cdf(self, X=None):
         """
@@ -37,7 +46,8 @@ class WeibullMin(_Continuous):
         **Output**
             CDF of X.
         """
-        return prob.cdf(X, c=self.c, loc=self.loc, scale=self.scale)
+        z = (np.asarray(X, dtype=float) - self.loc) / self.scale
+        return -np.expm1(-np.where(z <= 0, 0.0, z) ** self.c)[()]
 
     def icdf(self, y=None):
         """
@@ -50,7 +60,82 @@ class WeibullMin(_Continuous):
         **Output**
             Inverse CDF of X.
         """
-        return prob.ppf(y, c=self.c, loc=self.loc, scale=self.scale)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return (self.loc + self.scale * (-np.log1p(-_probability(y))) ** (1 / self.c))[()]
+
+    def sf(self, X=None):
+        """
+        Survival function (1 - CDF).
+
+        **Input:**
+        * **X** (`float`)
+            Argument.
+
+        **Output**
+            Survival function of X.
+        """
+        z = (np.asarray(X, dtype=float) - self.loc) / self.scale
+        return np.exp(-np.where(z <= 0, 0.0, z) ** self.c)[()]
+
+    def isf(self, y=None):
+        """
+        Inverse survival function.
+
+        **Input:**
+        * **y** (`float`)
+            Probability.
+
+        **Output**
+            Inverse survival function of y.
+        """
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return (self.loc + self.scale * (-np.log(_probability(y))) ** (1 / self.c))[()]
+
+    def logpdf(self, X=None):
+        """
+        Logarithm of the PDF.
+
+        **Input:**
+        * **X** (`float`)
+            Argument.
+
+        **Output**
+            Logarithm of the PDF of X.
+        """
+        z = (np.asarray(X, dtype=float) - self.loc) / self.scale
+        with np.errstate(divide='ignore', invalid='ignore'):
+            z_pos = np.where(z < 0, 0.0, z)
+            f = np.log(self.c) + xlogy(self.c - 1, z_pos) - z_pos ** self.c - np.log(self.scale)
+        return np.where(z < 0, -np.inf, f)[()]
+
+    def logcdf(self, X=None):
+        """
+        Logarithm of the CDF.
+
+        **Input:**
+        * **X** (`float`)
+            Argument.
+
+        **Output**
+            Logarithm of the CDF of X.
+        """
+        z = (np.asarray(X, dtype=float) - self.loc) / self.scale
+        with np.errstate(divide='ignore'):
+            return _log1mexp(np.where(z <= 0, 0.0, z) ** self.c)[()]
+
+    def logsf(self, X=None):
+        """
+        Logarithm of the survival function.
+
+        **Input:**
+        * **X** (`float`)
+            Argument.
+
+        **Output**
+            Logarithm of the survival function of X.
+        """
+        z = (np.asarray(X, dtype=float) - self.loc) / self.scale
+        return (-np.where(z <= 0, 0.0, z) ** self.c)[()]
 
     def moment(self, n=1):
         """
@@ -63,7 +148,7 @@ class WeibullMin(_Continuous):
         **Output**
             non central moment.
         """
-        return prob.moment(n, c=self.c, loc=self.loc, scale=self.scale)
+        return self._frozen.moment(n)
 
     def rvs(self, n_sim=1):
         """
@@ -76,4 +161,10 @@ class WeibullMin(_Continuous):
         **Output**
             Samples.
         """
-        return prob.rvs(c=self.c, loc=self.loc, scale=self.scale, size=n_sim, random_state=self.random_state)
+        return self._frozen.rvs(size=n_sim, random_state=self.random_state)
+
+
+def _probability(y):
+    # Probabilities outside [0, 1] are not valid, and give nan.
+    y = np.asarray(y, dtype=float)
+    return np.where((y < 0) | (y > 1), np.nan, y)
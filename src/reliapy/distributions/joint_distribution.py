@@ -1,5 +1,6 @@
 from reliapy._messages import *
-from reliapy.math import phi_pdf, nataf, transform_xz
+from reliapy.math import x2z, nataf, spectral_decomposition, cholesky_decomposition
+from scipy.stats import norm
 import numpy as np
 
 
@@ -20,6 +21,15 @@ class JointDistribution:
     * **decomposition** (`str`)
         Decomposition of the correlation method: `spectral` or `cholesky`.
 
+    * **correlation_z** (`str`)
+        Correlation matrix in Z: `approx` (equal to `Cx`) or `nataf` (Nataf model).
+
+    * **n_tasks** (`int`)
+        Number of processes used to solve the Nataf model.
+
+    * **cache_file** (`str`)
+        Path of a SQLite database where the solutions of the Nataf model are kept across sessions.
+
     **Attributes:**
 
     * **marginal** (`list`)
@@ -38,14 +48,22 @@ class JointDistribution:
         Decomposition of the correlation method: `spectral` or `cholesky`.
 
     * **mean** (`ndarray`)
-        Array of means.
+        Array of means, computed on first access.
 
     * **std** (`ndarray`)
-        Array of standard deviations.
+        Array of standard deviations, computed on first access.
+
+    * **Jyz** (`ndarray`)
+        Jacobian matrix for the transformation from Z to Y, cached until `Cz` is assigned (`Cz` is a read-only copy,
+        so it cannot be changed in place).
+
+    * **Jzy** (`ndarray`)
+        Jacobian matrix for the transformation from Y to Z, cached until `Cz` is assigned.
 
     """
 
-    def __init__(self, marginal=None, Cx=None, random_state=None, decomposition='spectral', correlation_z='approx'):
+    def __init__(self, marginal=None, Cx=None, random_state=None, decomposition='spectral', correlation_z='approx',
+                 n_tasks=1, cache_file=None):
 
         if not isinstance(marginal, list):
             type_error('distributions', 'list')
@@ -55,59 +73,142 @@ class JointDistribution:
         self.nrv = len(marginal)
         self.random_state = random_state
         self.decomposition = decomposition
+        self._jacobians = {}
 
         if correlation_z == 'approx':
             self.Cz = self.Cx
         elif correlation_z == 'nataf':
-            self.Cz = nataf(self.Cx)
+            self.Cz = nataf(self.Cx, marginal=self.marginal, n_tasks=n_tasks, cache_file=cache_file)
         else:
             not_implemented_error()
 
-        mean = []
-        std = []
-        for i in range(self.nrv):
-            m = marginal[i].stats[0]
-            s = np.sqrt(marginal[i].stats[1])
-            mean.append(m)
-            std.append(s)
+        # The moments of the marginal distributions are only computed when they are needed.
+        self._mean = None
+        self._std = None
+
+    @property
+    def mean(self):
+        if self._mean is None:
+            self._mean = np.array([m.mean for m in self.marginal])
+
+        return self._mean
+
+    @property
+    def std(self):
+        if self._std is None:
+            self._std = np.array([m.std for m in self.marginal])
 
-        self.mean = np.array(mean)
-        self.std = np.array(std)
+        return self._std
+
+    @property
+    def Cz(self):
+        return self._Cz
+
+    @Cz.setter
+    def Cz(self, Cz):
+        # The decompositions of the previous correlation matrix are no longer valid. A read-only copy is kept, so that
+        # in-place changes (of `Cz`, or of `Cx` when `correlation_z` is `approx`) cannot leave them stale.
+        self._Cz = np.array(Cz, dtype=float)
+        self._Cz.flags.writeable = False
+        self._jacobians = {}
+
+    def decompose(self, decomposition=None):
+        """
+        Get the Jacobians between Y and Z from the decomposition of `Cz`. The result is computed once for each method
+        and cached until `Cz` changes.
+
+        **Input:**
+        * **decomposition** (`str`)
+            Decomposition of the correlation method: `spectral` or `cholesky`. If `None`, `decomposition` of the
+            object is used.
+
+        **Output:**
+        * **Jyz** (`ndarray`)
+            Jacobian matrix for the transformation from Z to Y.
+
+        * **Jzy** (`ndarray`)
+            Jacobian matrix for the transformation from Y to Z.
+        """
+
+        if decomposition is None:
+            decomposition = self.decomposition
+
+        if decomposition not in self._jacobians:
+            if decomposition == 'spectral':
+                self._jacobians[decomposition] = spectral_decomposition(self.Cz)
+            elif decomposition == 'cholesky':
+                self._jacobians[decomposition] = cholesky_decomposition(self.Cz)
+            else:
+                not_implemented_error()
+
+        return self._jacobians[decomposition]
+
+    @property
+    def Jyz(self):
+        return self.decompose()[0]
+
+    @property
+    def Jzy(self):
+        return self.decompose()[1]
 
     def joint_pdf(self, X):
         """
         Joint PDF using the Nataf model.
 
         **Input:**
-        * **X** (`float`)
-            Argument.
+        * **X** (`ndarray`)
+            Argument, either a single point with shape `(nrv,)` or a matrix of points with shape `(n_sim, nrv)`.
 
         **Output**
-        * **joint_pdf_val** (`float`)
+        * **joint_pdf_val** (`float` or `ndarray`)
             Joint PDF for `X`.
         """
 
+        return np.exp(self.joint_logpdf(X))
+
+    def joint_logpdf(self, X):
+        """
+        Logarithm of the joint PDF using the Nataf model. It is computed as a sum of logarithms, so that it does not
+        underflow for many random variables or points far in the tails.
+
+        **Input:**
+        * **X** (`ndarray`)
+            Argument, either a single point with shape `(nrv,)` or a matrix of points with shape `(n_sim, nrv)`.
+
+        **Output**
+        * **joint_logpdf_val** (`float` or `ndarray`)
+            Logarithm of the joint PDF for `X`.
+        """
+
+        X = np.asarray(X, dtype=float)
+        single = X.ndim == 1
+        X = np.atleast_2d(X)
+
         # Check is the input is consistent with the proabbility distribution.
-        if len(X) != self.nrv:
+        if X.shape[1] != self.nrv:
             shape_error('X')
 
-        # Get the Jacobians.
-        Jxz, Jzx, M_eq, S_eq = transform_xz(X, distributions=self)
+        # Transform the input from X to Z, one marginal distribution at a time.
+        Z = np.empty(X.shape)
+        log_f = np.zeros(len(X))
+        for i in range(self.nrv):
+            Z[:, i] = x2z(X[:, i], distribution=self.marginal[i])
+            log_f = log_f + self.marginal[i].logpdf(X[:, i])
+
+        log_phi = np.sum(norm.logpdf(Z), axis=1)
 
-        # Transform the input from X to Z.
-        Z = Jzx @ (X - M_eq)
+        # Multivariate normal PDF using the cached Cholesky factor of Cz.
+        Jyz, Jzy = self.decompose('cholesky')
+        Y = Z @ Jyz.T
+        log_det = 2 * np.sum(np.log(np.diag(Jzy)))
+        log_phi_multi = -0.5 * np.sum(Y ** 2, axis=1) - 0.5 * log_det - 0.5 * self.nrv * np.log(2 * np.pi)
 
-        # Start the iterative process.
-        f_prod = 1
-        phi_prod = 1
-        for i in range(self.nrv):
-            f = self.marginal[i].pdf(X[i])
-            f_prod = f_prod * f
+        joint_logpdf_val = log_phi_multi + log_f - log_phi
 
-            phi = phi_pdf(Z[i])
-            phi_prod = phi_prod * phi
+        # Outside the support of a marginal distribution, Z is infinite and the difference of the logarithms is nan.
+        joint_logpdf_val[log_f == -np.inf] = -np.inf
 
-        phi_multi = phi_pdf(Z, corr=self.Cz)
-        joint_pdf_val = phi_multi * (f_prod / phi_prod)
+        if single:
+            joint_logpdf_val = joint_logpdf_val[0]
 
-        return joint_pdf_val
+        return joint_logpdf_val
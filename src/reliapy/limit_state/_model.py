@@ -1,7 +1,11 @@
 import numpy as np
+import copy
+from collections import OrderedDict
 from reliapy.math import numerical_gradient
+from reliapy.limit_state._store import _EvaluationStore
 from reliapy._messages import *
-# from multiprocessing import Pool
+from multiprocessing import Pool
+from multiprocessing.pool import ThreadPool
 
 
 class LimitState:
@@ -12,23 +16,83 @@ class LimitState:
     * **limit_state_function** (`callable`)
         Limit state function.
 
+    * **limit_state_gradient** (`callable`)
+        Gradient of the limit state function. If `None`, the gradient is obtained using finite differences.
+
+    * **limit_state_value_and_gradient** (`callable`)
+        Function returning both the value and the gradient of the limit state function (e.g., an adjoint solver).
+
+    * **gradient_scheme** (`str`)
+        Finite difference scheme used when no gradient is provided: `forward`, `central`, or `complex` (the limit
+        state function must accept complex arguments).
+
+    * **gradient_step** (`float`)
+        Relative step of the finite differences. If `None`, a default value suitable for `gradient_scheme` is used.
+
+    * **gradient_scale** (`ndarray`)
+        Typical scale of each random variable (e.g., the standard deviations) used in the step of the finite
+        differences.
+
     **Attributes:**
 
-    * **g** (`float`)
-        Result(s) of the limit state function.
+    * **g** (`ndarray`)
+        Result(s) of the limit state function with shape `(n_sim,)` or `(n_sim, n_lse + 1)`.
 
     * **X** (`ndarray`)
-        Random sample(s).
+        Random sample(s) with shape `(n_sim, nrv)`.
 
     * **n_sim** (`int`)
         Number of simulations.
 
     * **n_tasks** (`int`)
-        Number of threads in parallel computing.
+        Number of workers in parallel computing. For `n_tasks > 1`, `limit_state_function` must be picklable (e.g.,
+        defined at the module level) when `backend` is `process`.
+
+    * **backend** (`str`)
+        Parallel backend used when `n_tasks > 1`: `process` (pool of processes) or `thread` (pool of threads, suitable
+        for limit state functions that release the GIL).
+
+    * **vectorized** (`bool`)
+        If `True`, `limit_state_function` receives all the samples at once as an array of shape `(n_sim, nrv)` and
+        returns an array of shape `(n_sim,)` or `(n_sim, n_lse + 1)`.
+
+    * **cache_size** (`int`)
+        Maximum number of points kept in the least-recently-used caches of `function` and `gradient`. The caches are
+        disabled if `cache_size` is `None`.
+
+    * **cache_hits** (`int`)
+        Number of calls of `function` and `gradient` answered by the caches.
+
+    * **cache_misses** (`int`)
+        Number of calls of `function` and `gradient` that required the evaluation of the model.
+
+    * **n_stream** (`int`)
+        Number of samples evaluated by `stream`. They are not kept, so `X`, `g` and `n_sim` are reset by `stream`.
+
+    * **n_failure** (`int` or `ndarray`)
+        Number of samples with negative response(s) of the limit state function counted by `stream`.
+
+    * **X_failure** (`ndarray`)
+        Samples with negative response counted by `stream` when `keep_failures` is `True`.
+
+    * **g_failure** (`ndarray`)
+        Responses of the samples in `X_failure`.
+
+    * **store** (`str`)
+        Path of a SQLite database where every evaluation of the limit state function and its gradient is recorded.
+        The evaluations already in the database are reused instead of calling the model again, also across sessions.
+
+    * **store_key** (`str`)
+        Name identifying the limit state function in `store`, required when `store` is provided. Only the evaluations
+        recorded under the same `store_key` are reused, so a database can be shared by several models. The gradients
+        obtained by finite differences are reused only with the same `gradient_scheme`, `gradient_step` and
+        `gradient_scale`.
 
     """
 
-    def __init__(self, limit_state_function=None, limit_state_gradient=None, n_tasks=1):
+    def __init__(self, limit_state_function=None, limit_state_gradient=None, n_tasks=1, backend='process',
+                 vectorized=False, cache_size=None, store=None, store_key=None, limit_state_value_and_gradient=None,
+                 gradient_scheme='central', gradient_step=None, gradient_scale=None):
 
         if callable(limit_state_function):
             self.limit_state_function = limit_state_function
@@ -40,16 +104,65 @@ class LimitState:
         else:
             self.limit_state_gradient = None
 
+        if callable(limit_state_value_and_gradient):
+            self.limit_state_value_and_gradient = limit_state_value_and_gradient
+        else:
+            self.limit_state_value_and_gradient = None
+
+        if not isinstance(n_tasks, int):
+            type_error('n_tasks', 'int')
+        elif n_tasks < 1:
+            value_error('n_tasks')
+
+        if backend not in ['process', 'thread']:
+            not_implemented_error()
+
+        if gradient_scheme not in ['forward', 'central', 'complex']:
+            not_implemented_error()
+
+        if not isinstance(vectorized, bool):
+            type_error('vectorized', 'bool')
+
+        if cache_size is not None:
+            if not isinstance(cache_size, int):
+                type_error('cache_size', 'int')
+            elif cache_size < 1:
+                value_error('cache_size')
+
+        if store is not None and not isinstance(store_key, str):
+            type_error('store_key', 'str')
+
         # if not isinstance(n_lse, int):
         #     type_error('n_lse', 'int')
         # elif n_lse < 1:
         #     value_error('n_lse')
 
-        self.X = None
-        self.g = None
+        self._X = None
+        self._g = None
         self.n_sim = None
+        self.n_stream = None
+        self.n_failure = None
+        self.X_failure = None
+        self.g_failure = None
         # self.n_lse = n_lse
         self.n_tasks = n_tasks
+        self.backend = backend
+        self.vectorized = vectorized
+        self.gradient_scheme = gradient_scheme
+        self.gradient_step = gradient_step
+        self.gradient_scale = gradient_scale
+        self.cache_size = cache_size
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self._cache_g = OrderedDict()
+        self._cache_dg = OrderedDict()
+        self.store = store
+        self.store_key = store_key
+
+        if store is None:
+            self._store = None
+        else:
+            self._store = _EvaluationStore(path=store, key=store_key, gradient_key=self._gradient_key())
 
     def function(self, X):
         """
@@ -64,7 +177,25 @@ class LimitState:
             Value of the limit state function.
         """
 
-        g = self.limit_state_function(X)
+        g = self._lookup(X, field='g')
+
+        if g is None:
+            g = self._function(X)
+
+        return g
+
+    def _function(self, X):
+        """
+        Private method evaluating the limit state function at `X` (without looking it up), and recording the value.
+        """
+
+        if self.vectorized:
+            # Evaluate a single point as a batch with one row.
+            g = _point_value(self._run_vectorized(np.atleast_2d(X))[0])
+        else:
+            g = self.limit_state_function(X)
+
+        self._record(X, g, field='g')
 
         return g
 
@@ -81,16 +212,189 @@ class LimitState:
             Gradient of the limit state function.
         """
 
-        if self.limit_state_gradient is None:
-            # Get the gradient using finite differences.
-            dg = numerical_gradient(X, self.limit_state_function)
+        dg = self._lookup(X, field='dg')
+
+        if dg is None:
+            dg = self._gradient(X)
+
+        return dg
+
+    def value_and_gradient(self, X):
+        """
+        Get the value and the gradient of the limit state function at the same point. If
+        `limit_state_value_and_gradient` is provided, both are obtained from a single call; otherwise, the value at `X`
+        is shared with the finite differences.
+
+        **Input:**
+        * **X** (`ndarray`)
+            Samples of a random variable.
 
+        * **Output:**
+        * **g** (`float` ot `tuple`)
+            Value of the limit state function.
+
+        * **dg** (`ndarray` ot `tuple`)
+            Gradient of the limit state function.
+        """
+
+        g = self._lookup(X, field='g')
+        dg = self._lookup(X, field='dg')
+
+        if g is not None and dg is not None:
+            pass
+        elif self.limit_state_value_and_gradient is not None:
+            g, dg = self.limit_state_value_and_gradient(X)
+            self._record(X, g, field='g')
+            self._record(X, dg, field='dg')
         else:
+            if g is None:
+                g = self._function(X)
+
+            if dg is None:
+                dg = self._gradient(X, g=g)
+
+        return g, dg
+
+    def _gradient(self, X, g=None):
+        """
+        Private method computing the gradient of the limit state function, either analytically or numerically.
+
+        **Input:**
+        * **X** (`ndarray`)
+            Samples of a random variable.
+
+        * **g** (`float` ot `tuple`)
+            Value of the limit state function at `X`, if already available.
+
+        * **Output:**
+        * **dg** (`ndarray` ot `tuple`)
+            Gradient of the limit state function.
+        """
+
+        if self.limit_state_gradient is not None:
             # Get the analytical gradient.
             dg = self.limit_state_gradient(X)
+        elif self.limit_state_value_and_gradient is not None:
+            g, dg = self.limit_state_value_and_gradient(X)
+            self._record(X, g, field='g')
+        else:
+            # Get the gradient using finite differences.
+            if self.gradient_scheme == 'complex':
+                # The complex perturbations must reach the model without being converted to float.
+                if self.vectorized:
+                    fun, fun_batch = self.function, self.limit_state_function
+                else:
+                    fun, fun_batch = self.limit_state_function, None
+            else:
+                fun, fun_batch = self.function, self._run
+
+            dg = numerical_gradient(X, fun, f0=g, fun_batch=fun_batch, scheme=self.gradient_scheme,
+                                    h=self.gradient_step, scale=self.gradient_scale)
+
+        self._record(X, dg, field='dg')
 
         return dg
 
+    def clear_cache(self):
+        """
+        Remove all the points stored in the caches of `function` and `gradient`, and reset the counters.
+        """
+
+        self._cache_g.clear()
+        self._cache_dg.clear()
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def _gradient_key(self):
+        """
+        Private method identifying how the gradient is obtained, so that the gradients in `store` are reused only
+        when they were obtained in the same way.
+        """
+
+        if self.limit_state_gradient is not None or self.limit_state_value_and_gradient is not None:
+            return 'analytical'
+
+        if self.gradient_scale is None:
+            scale = None
+        else:
+            scale = np.asarray(self.gradient_scale, dtype=float).tolist()
+
+        return repr((self.gradient_scheme, self.gradient_step, scale))
+
+    def _lookup(self, X, field='g'):
+        """
+        Private method looking up the value (`g`) or the gradient (`dg`) at `X`, first in the cache and then in the
+        store. It returns `None` if it is not available.
+        """
+
+        if field == 'g':
+            cache = self._cache_g
+        else:
+            cache = self._cache_dg
+
+        if self.cache_size is not None:
+            key = np.asarray(X, dtype=float).tobytes()
+            if key in cache:
+                self.cache_hits = self.cache_hits + 1
+                cache.move_to_end(key)
+
+                # Return a copy so that the caller cannot modify the stored value.
+                return copy.deepcopy(cache[key])
+
+        value = None
+        if self._store is not None:
+            value = self._store.get(X, field=field)
+
+            if value is not None:
+                self._cache_set(cache, X, value)
+
+        if value is None and (self.cache_size is not None or self._store is not None):
+            # Neither the cache nor the store has the point, so the model must be evaluated.
+            self.cache_misses = self.cache_misses + 1
+
+        return value
+
+    def _record(self, X, value, field='g'):
+        """
+        Private method recording the value (`g`) or the gradient (`dg`) at `X` in the cache and in the store.
+        """
+
+        if field == 'g':
+            cache = self._cache_g
+        else:
+            cache = self._cache_dg
+
+        if self._store is not None:
+            self._store.put(X, value, field=field)
+
+        self._cache_set(cache, X, value)
+
+    def _cache_set(self, cache, X, value):
+        """
+        Private method storing a value in a cache and discarding the least recently used one if it is full.
+        """
+
+        if self.cache_size is None:
+            return
+
+        cache[np.asarray(X, dtype=float).tobytes()] = copy.deepcopy(value)
+        if len(cache) > self.cache_size:
+            cache.popitem(last=False)
+
+    @property
+    def X(self):
+        if self._X is None:
+            return None
+
+        return self._X[:self.n_sim]
+
+    @property
+    def g(self):
+        if self._g is None:
+            return None
+
+        return self._g[:self.n_sim]
+
     def run(self, X=None):
         """
         Get the responses of the limit state functions for the samples in `X`.
@@ -104,15 +408,16 @@ class LimitState:
         if X is None:
             raise ValueError('reliapy: `X` must be provided as input.')
         elif isinstance(X, list) or isinstance(X, np.ndarray):
-            self.n_sim = len(X)  # This assumes that the number of rows is the number of simulations.
-            self.X = X
+            X = np.array(X, dtype=float)
         else:
             raise TypeError('reliapy: `X` must be passed either as a `list` or `ndarray`')
 
-        if self.n_tasks == 1:
-            self.g = self._run_serial(X)
-        else:
-            raise NotImplementedError('reliapy: multiprocessing not available yet.')
+        g = np.asarray(self._run(X), dtype=float)
+
+        self._X = None
+        self._g = None
+        self.n_sim = 0
+        self._push(X, g)
 
     def append(self, X=None):
         """
@@ -127,20 +432,170 @@ class LimitState:
         if X is None:
             raise ValueError('reliapy: `X` must be provided as input.')
         elif isinstance(X, list) or isinstance(X, np.ndarray):
-            n_sim_append = len(X)  # This assumes that the number of rows is the number of simulations.
+            X = np.array(X, dtype=float)
         else:
             raise TypeError('reliapy: `X` must be passed either as a `list` or `ndarray`')
 
-        if self.n_tasks == 1:
-            g_append = self._run_serial(X)
+        g_append = np.asarray(self._run(X), dtype=float)
+
+        if self.n_sim is None:
+            self.n_sim = 0
+
+        self._push(X, g_append)
+
+    def stream(self, samples=None, keep_failures=False):
+        """
+        Evaluate the limit state functions for chunks of samples keeping only running reductions, so that the memory
+        depends on the size of the chunks and not on the total number of simulations. For systems, the failure is
+        defined by the first response of the limit state function.
+
+        **Input:**
+        * **samples** (`iterable`)
+            Iterable (e.g., a generator) of chunks of samples of a random variable.
+
+        * **keep_failures** (`bool`)
+            If `True`, keep the samples with negative response in `X_failure` and `g_failure`.
+
+        """
+
+        if samples is None:
+            raise ValueError('reliapy: `samples` must be provided as input.')
+
+        # The streamed samples are not stored, so they are counted apart from the samples in `X`.
+        self._X = None
+        self._g = None
+        self.n_sim = None
+        self.n_stream = 0
+        self.n_failure = 0
+        X_failure = []
+        g_failure = []
+        for X in samples:
+            X = np.array(X, dtype=float)
+            g = np.asarray(self._run(X), dtype=float)
+
+            # Count the failures of each response.
+            self.n_failure = self.n_failure + np.sum(g < 0, axis=0)
+            self.n_stream = self.n_stream + len(X)
+
+            if keep_failures:
+                if g.ndim == 1:
+                    failure = g < 0
+                else:
+                    failure = g[:, 0] < 0
+
+                X_failure.append(X[failure])
+                g_failure.append(g[failure])
+
+        if keep_failures and len(X_failure) > 0:
+            self.X_failure = np.concatenate(X_failure)
+            self.g_failure = np.concatenate(g_failure)
+        else:
+            self.X_failure = None
+            self.g_failure = None
+
+    def _push(self, X=None, g=None):
+        """
+        Private method copying the samples and the responses at the end of the storage buffers. The buffers grow
+        geometrically, so that appending samples in rounds has an amortized constant cost per sample.
+
+        **Input:**
+        * **X** (`ndarray`)
+            Samples of a random variable.
+
+        * **g** (`ndarray`)
+            Result(s) of the limit state function.
+
+        """
+
+        n_sim_append = len(X)  # This assumes that the number of rows is the number of simulations.
+        n_total = self.n_sim + n_sim_append
+
+        if self._X is not None and (X.shape[1:] != self._X.shape[1:] or g.shape[1:] != self._g.shape[1:]):
+            shape_error('X or g')
+
+        if self._X is None or n_total > len(self._X):
+            if self._X is None:
+                capacity = n_total
+            else:
+                capacity = max(n_total, 2 * len(self._X))
+
+            X_buffer = np.empty((capacity,) + X.shape[1:], dtype=float)
+            g_buffer = np.empty((capacity,) + g.shape[1:], dtype=float)
+            if self._X is not None:
+                X_buffer[:self.n_sim] = self._X[:self.n_sim]
+                g_buffer[:self.n_sim] = self._g[:self.n_sim]
+
+            self._X = X_buffer
+            self._g = g_buffer
+
+        self._X[self.n_sim:n_total] = X
+        self._g[self.n_sim:n_total] = g
+        self.n_sim = n_total
+
+    def _run(self, X=None):
+        """
+        Private Method for getting the responses of the limit state function for the samples in `X`, reusing the
+        evaluations available in `store`.
+
+        **Input:**
+        * **X** (`ndarray`)
+            Samples of a random variable.
+
+        **Output:**
+        * **g** (`list` or `ndarray`)
+            Result(s) of the limit state function.
+
+        """
+
+        if self._store is None:
+            return self._evaluate(X)
+
+        g = self._store.get_many(X, field='g')
+
+        # Evaluate only the samples that are not in the store.
+        missing = [i for i in range(len(X)) if g[i] is None]
+        if len(missing) > 0:
+            if isinstance(X, np.ndarray):
+                X_missing = X[missing]
+            else:
+                X_missing = [X[i] for i in missing]
+
+            g_missing = self._evaluate(X_missing)
+            if self.vectorized:
+                g_missing = [_point_value(g_) for g_ in g_missing]
+
+            self._store.put_many(X_missing, g_missing, field='g')
+            for i, g_ in zip(missing, g_missing):
+                g[i] = g_
+
+        if self.vectorized:
+            g = np.array(g, dtype=float)
+
+        return g
+
+    def _evaluate(self, X=None):
+        """
+        Private Method for dispatching the computation of the limit state function to the serial, vectorized or
+        parallel implementation.
+
+        **Input:**
+        * **X** (`ndarray`)
+            Samples of a random variable.
+
+        **Output:**
+        * **g** (`list` or `ndarray`)
+            Result(s) of the limit state function.
+
+        """
 
-            for i in range(n_sim_append):
-                self.g.append(g_append[i])
-                self.X.append(X[i])
+        if self.n_tasks > 1:
+            g = self._run_parallel(X)
+        elif self.vectorized:
+            g = self._run_vectorized(X)
         else:
-            raise NotImplementedError('reliapy: multiprocessing not available yet.')
+            g = self._run_serial(X)
 
-        self.n_sim = self.n_sim + n_sim_append
+        return g
 
     def _run_serial(self, X=None):
         """
@@ -165,3 +620,125 @@ class LimitState:
             g.append(state_lim)
 
         return g
+
+    def _run_vectorized(self, X=None):
+        """
+        Private Method for performing the computation of the limit state function for all the samples at once.
+
+        **Input:**
+        * **X** (`ndarray`)
+            Samples of a random variable with shape `(n_sim, nrv)`.
+
+        **Output:**
+        * **g** (`ndarray`)
+            Result(s) of the limit state function with shape `(n_sim,)` or `(n_sim, n_lse + 1)`.
+
+        """
+
+        n_sim = len(X)  # This assumes that the number of rows is the number of simulations.
+
+        # Run python model
+        g = np.asarray(self.limit_state_function(X), dtype=float)
+
+        if g.ndim not in (1, 2) or len(g) != n_sim:
+            shape_error('g')
+
+        return g
+
+    def _run_parallel(self, X=None):
+        """
+        Private Method for performing the parallel computation of the limit state function in a pool of `n_tasks`
+        processes or threads, according to `backend`. The samples are split in contiguous chunks and the results are
+        reassembled in the original order.
+
+        **Input:**
+        * **X** (`ndarray`)
+            Samples of a random variable.
+
+        **Output:**
+        * **g** (`list` or `ndarray`)
+            Result(s) of the limit state function.
+
+        """
+
+        n_sim = len(X)  # This assumes that the number of rows is the number of simulations.
+
+        if n_sim == 0:
+            # There is nothing to split among the workers.
+            return np.zeros(0) if self.vectorized else []
+
+        # Use a few chunks per worker to balance evaluations with different costs.
+        n_chunks = min(n_sim, 4 * self.n_tasks)
+        chunks = [X[idx[0]:idx[-1] + 1] for idx in np.array_split(np.arange(n_sim), n_chunks) if len(idx) > 0]
+        args = [(self.limit_state_function, chunk, self.vectorized) for chunk in chunks]
+
+        # Threads share the memory of the main process, so neither the function nor the samples are pickled.
+        if self.backend == 'thread':
+            pool_type = ThreadPool
+        else:
+            pool_type = Pool
+
+        with pool_type(processes=self.n_tasks) as pool:
+            g_chunks = pool.starmap(_run_chunk, args)
+
+        if self.vectorized:
+            g = np.concatenate(g_chunks)
+
+            if g.ndim not in (1, 2) or len(g) != n_sim:
+                shape_error('g')
+
+        else:
+            g = [g_ for g_chunk in g_chunks for g_ in g_chunk]
+
+        return g
+
+
+def _point_value(g):
+    """
+    Private function converting the response of the limit state function for a single point into a `float` (single
+    limit state) or a `tuple` (system).
+
+    **Input:**
+    * **g** (`float` or `ndarray`)
+        Response of the limit state function.
+
+    **Output:**
+    * **g** (`float` or `tuple`)
+        Response of the limit state function.
+
+    """
+
+    if np.ndim(g) == 0:
+        g = float(g)
+    else:
+        g = tuple(float(g_) for g_ in g)
+
+    return g
+
+
+def _run_chunk(limit_state_function, X, vectorized):
+    """
+    Private function evaluating the limit state function for a chunk of samples in a worker.
+
+    **Input:**
+    * **limit_state_function** (`callable`)
+        Limit state function.
+
+    * **X** (`ndarray`)
+        Chunk of samples of a random variable.
+
+    * **vectorized** (`bool`)
+        If `True`, `limit_state_function` is evaluated for all the samples of the chunk at once.
+
+    **Output:**
+    * **g** (`list` or `ndarray`)
+        Result(s) of the limit state function.
+
+    """
+
+    if vectorized:
+        g = np.asarray(limit_state_function(X), dtype=float)
+    else:
+        g = [limit_state_function(X[i]) for i in range(len(X))]
+
+    return g
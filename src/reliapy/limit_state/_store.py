@@ -0,0 +1,166 @@
+import numpy as np
+import pickle
+import sqlite3
+
+
+class _EvaluationStore:
+    """
+    ``_EvaluationStore`` is a private class implementing a persistent store of the evaluations of a limit state
+    function in a SQLite database. Each point `x` is stored together with the value `g` and the gradient `dg` of the
+    limit state function, when available. The evaluations are recorded under `key`, so that several models can share
+    the same database, and the gradients are recorded under `gradient_key` as well, since the finite differences
+    depend on the scheme and on the step.
+
+    **Input:**
+    * **path** (`str`)
+        Path of the SQLite database. It is created if it does not exist.
+
+    * **key** (`str`)
+        Name identifying the limit state function.
+
+    * **gradient_key** (`str`)
+        Name identifying how the gradient is obtained.
+
+    **Attributes:**
+
+    * **path** (`str`)
+        Path of the SQLite database.
+
+    * **key** (`str`)
+        Name identifying the limit state function.
+
+    * **gradient_key** (`str`)
+        Name identifying how the gradient is obtained.
+
+    """
+
+    def __init__(self, path=None, key=None, gradient_key=''):
+
+        if not isinstance(path, str):
+            raise TypeError('reliapy: `store` must be a `str` with the path of the database.')
+
+        if not isinstance(key, str):
+            raise TypeError('reliapy: `store_key` must be a `str` identifying the limit state function.')
+
+        self.path = path
+        self.key = key
+        self.gradient_key = gradient_key
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute('CREATE TABLE IF NOT EXISTS evaluations '
+                                 '(key TEXT, x BLOB, g BLOB, PRIMARY KEY (key, x))')
+        self._connection.execute('CREATE TABLE IF NOT EXISTS gradients '
+                                 '(key TEXT, gradient TEXT, x BLOB, dg BLOB, PRIMARY KEY (key, gradient, x))')
+        self._connection.commit()
+
+    def get(self, x, field='g'):
+        """
+        Get the value stored for the point `x`.
+
+        **Input:**
+        * **x** (`ndarray`)
+            Point of a random variable.
+
+        * **field** (`str`)
+            Stored quantity: `g` or `dg`.
+
+        **Output:**
+        * **value** (`float`, `tuple` or `ndarray`)
+            Stored value, or `None` if it is not available.
+        """
+
+        return self.get_many([x], field=field)[0]
+
+    def get_many(self, X, field='g'):
+        """
+        Get the values stored for the samples in `X`.
+
+        **Input:**
+        * **X** (`ndarray`)
+            Samples of a random variable.
+
+        * **field** (`str`)
+            Stored quantity: `g` or `dg`.
+
+        **Output:**
+        * **values** (`list`)
+            Stored values, with `None` for the samples that are not available.
+        """
+
+        table, column, names, namespace = self._table(field)
+        keys = [self._key(X[i]) for i in range(len(X))]
+
+        # Query the samples in chunks, to stay below the limit of SQLite on the number of parameters.
+        found = {}
+        for start in range(0, len(keys), _CHUNK_SIZE):
+            chunk = keys[start:start + _CHUNK_SIZE]
+            query = ('SELECT x, ' + column + ' FROM ' + table + ' WHERE ' + ' AND '.join(n + ' = ?' for n in names) +
+                     ' AND x IN (' + ', '.join('?' * len(chunk)) + ')')
+            for x_key, blob in self._connection.execute(query, namespace + tuple(chunk)):
+                found[x_key] = blob
+
+        return [pickle.loads(found[x_key]) if x_key in found else None for x_key in keys]
+
+    def put(self, x, value, field='g'):
+        """
+        Store the value for the point `x`.
+
+        **Input:**
+        * **x** (`ndarray`)
+            Point of a random variable.
+
+        * **value** (`float`, `tuple` or `ndarray`)
+            Value to be stored.
+
+        * **field** (`str`)
+            Stored quantity: `g` or `dg`.
+        """
+
+        self.put_many([x], [value], field=field)
+
+    def put_many(self, X, values, field='g'):
+        """
+        Store the values for the samples in `X` in a single transaction.
+
+        **Input:**
+        * **X** (`ndarray`)
+            Samples of a random variable.
+
+        * **values** (`list`)
+            Values to be stored.
+
+        * **field** (`str`)
+            Stored quantity: `g` or `dg`.
+        """
+
+        table, column, names, namespace = self._table(field)
+        query = ('INSERT OR REPLACE INTO ' + table + ' (' + ', '.join(names) + ', x, ' + column + ') VALUES (' +
+                 ', '.join('?' * (len(names) + 2)) + ')')
+        rows = [namespace + (self._key(X[i]), pickle.dumps(values[i], protocol=pickle.HIGHEST_PROTOCOL))
+                for i in range(len(X))]
+
+        with self._connection:
+            self._connection.executemany(query, rows)
+
+    def close(self):
+        """
+        Close the connection with the database.
+        """
+
+        self._connection.close()
+
+    @staticmethod
+    def _key(x):
+        return np.asarray(x, dtype=float).tobytes()
+
+    def _table(self, field):
+        # Table, column and namespace (names and values of the key columns) where `field` is stored.
+        if field == 'g':
+            return 'evaluations', 'g', ('key',), (self.key,)
+        elif field == 'dg':
+            return 'gradients', 'dg', ('key', 'gradient'), (self.key, self.gradient_key)
+        else:
+            raise ValueError('reliapy: `field` must be either `g` or `dg`.')
+
+
+# Maximum number of samples looked up in a single query.
+_CHUNK_SIZE = 500
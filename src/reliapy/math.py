@@ -1,16 +1,21 @@
 import numpy as np
 import scipy as sp
 from scipy.stats import norm, multivariate_normal
+from scipy.special import ndtr, ndtri_exp
 from scipy.stats import multivariate_normal as multi_norm
 import scipy.integrate as si
-import copy
+import sqlite3
+from multiprocessing import Pool
 from reliapy._messages import *
 import sys
 
 
-def nataf(Cx, max_iter=5, tol=1e-10):
+def nataf(Cx, max_iter=5, tol=1e-10, method='gauss_hermite', n_points=32, marginal=None, closed_form=True, n_tasks=1,
+          cache_file=None):
     """
-    Nataf model for the transformation of the correlation matrix from the domain X to Z.
+    Nataf model for the transformation of the correlation matrix from the domain X to Z. The solutions of the pairs
+    of random variables are cached in memory (and optionally on disk), so that pairs with the same marginal
+    distributions (up to location and scale) and the same correlation in X are solved only once.
 
     **Input:**
     * **Cx** (`ndarray`)
@@ -19,6 +24,516 @@ def nataf(Cx, max_iter=5, tol=1e-10):
     * **max_iter** (`int`)
         Maximum number of iterations.
 
+    * **tol** (`float`)
+        Error tolerance.
+
+    * **method** (`str`)
+        Integration method: `gauss_hermite` (tensor-product Gauss-Hermite quadrature with Newton iterations using
+        the analytical derivative with respect to the correlation in Z) or `dblquad` (adaptive integration in the
+        standard normal space, which does not account for the marginal distributions).
+
+    * **n_points** (`int`)
+        Number of Gauss-Hermite points per dimension.
+
+    * **marginal** (`list`)
+        A list of objects of marginal distribution. If `None`, the marginal distributions are standard normal.
+
+    * **closed_form** (`bool`)
+        If `True`, use the approximations of Der Kiureghian and Liu (1986) for the pairs of marginal distributions
+        available in closed form (Normal, LogNormal, Gumbel_R, WeibullMin, Gamma, Uniform and Expon), within the
+        range of shapes and correlations where they are accurate.
+
+    * **n_tasks** (`int`)
+        Number of processes solving the pairs of random variables in parallel.
+
+    * **cache_file** (`str`)
+        Path of a SQLite database used to keep the solved pairs across sessions.
+
+    **Output**
+    * **Cz** (`ndarray`)
+        Correlation matrix in Z.
+    """
+
+    if method == 'dblquad':
+        return _nataf_dblquad(Cx, max_iter=max_iter, tol=tol)
+    elif method != 'gauss_hermite':
+        not_implemented_error()
+
+    rows, cols = np.shape(Cx)
+    if marginal is None:
+        marginal = [None] * rows
+    elif len(marginal) != rows:
+        shape_error('Cx or marginal')
+
+    if cache_file is not None:
+        _nataf_cache_load(cache_file)
+
+    # Collect the pairs that are not in the cache, solving each distinct pair only once.
+    specs = [_marginal_spec(m) for m in marginal]
+    keys = {}
+    problems = {}
+    for i in np.arange(0, rows):
+        for j in np.arange(i + 1, cols):
+            if Cx[i, j] == 0:
+                continue
+
+            key = _nataf_key(specs[i], specs[j], Cx[i, j], max_iter, tol, n_points, closed_form)
+            keys[(i, j)] = key
+            if key not in _NATAF_CACHE and key not in problems:
+                problems[key] = (Cx[i, j], marginal[i], marginal[j], max_iter, tol, n_points, closed_form)
+
+    if len(problems) > 0:
+        if n_tasks > 1:
+            with Pool(processes=n_tasks) as pool:
+                solutions = pool.starmap(_nataf_pair, problems.values())
+        else:
+            solutions = [_nataf_pair(*args) for args in problems.values()]
+
+        new_entries = dict(zip(problems.keys(), solutions))
+        _NATAF_CACHE.update(new_entries)
+
+        if cache_file is not None:
+            _nataf_cache_save(cache_file, new_entries)
+
+    Cz = np.eye(rows)
+    for (i, j), key in keys.items():
+        rho_z = _NATAF_CACHE[key]
+        Cz[i, j] = rho_z
+        Cz[j, i] = rho_z
+
+    return Cz
+
+
+# Solutions of the Nataf model for pairs of random variables, shared by all the calls of `nataf`.
+_NATAF_CACHE = {}
+
+
+def _nataf_pair(rho_x, marginal_i, marginal_j, max_iter=5, tol=1e-10, n_points=32, closed_form=True):
+    """
+    Private method computing the correlation coefficient in Z for a pair of random variables.
+
+    **Input:**
+    * **rho_x** (`float`)
+        Correlation coefficient in X.
+
+    * **marginal_i** (`object`)
+        Marginal distribution of the first random variable. If `None`, it is standard normal.
+
+    * **marginal_j** (`object`)
+        Marginal distribution of the second random variable. If `None`, it is standard normal.
+
+    **Output**
+    * **rho_z** (`float`)
+        Correlation coefficent in Z.
+    """
+
+    rho_z = None
+    if closed_form and marginal_i is not None and marginal_j is not None:
+        rho_z = _nataf_closed_form(rho_x, marginal_i, marginal_j)
+
+    if rho_z is None:
+        grid = _gauss_hermite_grid(n_points)
+        rho_z = _nataf_newton(rho_x, grid, max_iter=max_iter, tol=tol, marginal_i=marginal_i, marginal_j=marginal_j)
+
+    return float(rho_z)
+
+
+def _marginal_spec(marginal):
+    """
+    Private method describing a marginal distribution by its class and its shape parameters. The location and scale
+    are not included because the Nataf model does not depend on them.
+    """
+
+    if marginal is None:
+        return ('StandardNormal',)
+
+    params = []
+    for name, value in sorted(vars(marginal).items()):
+        if name in ['loc', 'scale', 'random_state'] or name.startswith('_'):
+            continue
+
+        if value is None or isinstance(value, (bool, int, float, np.number)):
+            params.append((name, value))
+
+    return (type(marginal).__name__,) + tuple(params)
+
+
+def _nataf_key(spec_i, spec_j, rho_x, max_iter, tol, n_points, closed_form):
+    """
+    Private method returning the key of a pair of random variables in the cache of the Nataf model. The settings of
+    the Newton iterations are part of the key, since they determine the accuracy of the solution.
+    """
+
+    # The problem is symmetric with respect to the order of the random variables.
+    spec_i, spec_j = sorted([spec_i, spec_j], key=repr)
+
+    return repr((spec_i, spec_j, float(rho_x), int(max_iter), float(tol), n_points, closed_form))
+
+
+def _nataf_cache_load(cache_file):
+    """
+    Private method loading the solutions of the Nataf model stored in `cache_file` into memory.
+    """
+
+    with sqlite3.connect(cache_file) as connection:
+        connection.execute('CREATE TABLE IF NOT EXISTS nataf (key TEXT PRIMARY KEY, rho_z REAL)')
+        for key, rho_z in connection.execute('SELECT key, rho_z FROM nataf'):
+            _NATAF_CACHE[key] = rho_z
+
+    connection.close()
+
+
+def _nataf_cache_save(cache_file, entries):
+    """
+    Private method storing new solutions of the Nataf model in `cache_file`.
+    """
+
+    with sqlite3.connect(cache_file) as connection:
+        connection.executemany('INSERT OR REPLACE INTO nataf (key, rho_z) VALUES (?, ?)', entries.items())
+
+    connection.close()
+
+
+def _nataf_newton(rho_x, grid, max_iter=5, tol=1e-10, marginal_i=None, marginal_j=None):
+    """
+    Private method solving the Nataf integral equation for a pair of random variables using the Newton method.
+
+    **Input:**
+    * **rho_x** (`float`)
+        Correlation coefficient in X.
+
+    * **grid** (`tuple`)
+        Nodes and weights of the Gauss-Hermite quadrature.
+
+    * **max_iter** (`int`)
+        Maximum number of iterations.
+
+    * **tol** (`float`)
+        Error tolerance.
+
+    * **marginal_i** (`object`)
+        Marginal distribution of the first random variable. If `None`, it is standard normal.
+
+    * **marginal_j** (`object`)
+        Marginal distribution of the second random variable. If `None`, it is standard normal.
+
+    **Output**
+    * **rho_z** (`float`)
+        Correlation coefficent in Z.
+    """
+
+    # The first random variable does not depend on `rho_z`.
+    u, v, w = grid
+    x_i, dx_i = _nataf_marginal(u, marginal_i)
+
+    # Moments of the marginal distributions with the same quadrature.
+    x_j0, _ = _nataf_marginal(u, marginal_j)
+    m_i = np.sum(w * x_i)
+    m_j = np.sum(w * x_j0)
+    s_i = np.sqrt(np.sum(w * (x_i - m_i) ** 2))
+    s_j = np.sqrt(np.sum(w * (x_j0 - m_j) ** 2))
+
+    # Initial guess.
+    rho_z = rho_x
+
+    itera = 0
+    while itera < max_iter:
+        rho_x_, d_rho_x_ = _func_nataf_quadrature(rho_z, grid, x_i, dx_i, m_i, m_j, s_i, s_j, marginal_j)
+        err = rho_x_ - rho_x
+
+        if abs(err) < tol:
+            break
+
+        # Keep the correlation coefficient strictly inside (-1, 1).
+        rho_z = np.clip(rho_z - err / d_rho_x_, -1 + 1e-10, 1 - 1e-10)
+
+        itera = itera + 1
+
+    return rho_z
+
+
+def _gauss_hermite_grid(n_points=32):
+    """
+    Private method returning the nodes and weights of the tensor-product Gauss-Hermite quadrature for the expectation
+    with respect to two independent standard normal random variables.
+
+    **Input:**
+    * **n_points** (`int`)
+        Number of points per dimension.
+
+    **Output**
+    * **u** (`ndarray`)
+        First coordinate of the nodes.
+
+    * **v** (`ndarray`)
+        Second coordinate of the nodes.
+
+    * **w** (`ndarray`)
+        Weights.
+    """
+
+    t, w = np.polynomial.hermite_e.hermegauss(n_points)
+    w = w / np.sqrt(2 * np.pi)
+
+    u, v = np.meshgrid(t, t, indexing='ij')
+    w = np.outer(w, w)
+
+    return u.ravel(), v.ravel(), w.ravel()
+
+
+def _nataf_marginal(z, marginal=None):
+    """
+    Private method transforming standard normal values into a marginal distribution, `x = F^-1(Phi(z))`, and
+    computing the derivative `dx/dz`.
+
+    **Input:**
+    * **z** (`ndarray`)
+        Standard normal values.
+
+    * **marginal** (`object`)
+        Marginal distribution. If `None`, it is standard normal.
+
+    **Output**
+    * **x** (`ndarray`)
+        Transformed values.
+
+    * **dx** (`ndarray`)
+        Derivative of `x` with respect to `z`.
+    """
+
+    if marginal is None:
+        return z, np.ones(np.shape(z))
+
+    # The outermost nodes have negligible weights; clipping them avoids evaluating quantiles (possibly by numerical
+    # root-finding) at probabilities far beyond the ones that matter.
+    x = z2x(np.clip(z, -8, 8), marginal)
+    f = marginal.pdf(x)
+    dx = np.divide(norm.pdf(z), f, out=np.zeros(np.shape(z)), where=f > 0)
+
+    return x, dx
+
+
+def _func_nataf_quadrature(rho_z, grid, x_i, dx_i, m_i, m_j, s_i, s_j, marginal_j=None):
+    """
+    Private method computing the correlation coefficient in X for a given `rho_z`, and its derivative with respect to
+    `rho_z`, using the Gauss-Hermite quadrature. The correlated pair is written as `z1 = u` and
+    `z2 = rho_z u + sqrt(1 - rho_z^2) v`, with `u` and `v` independent, so that the grid does not depend on `rho_z`.
+
+    **Input:**
+    * **rho_z** (`float`)
+        Correlation coefficent in Z.
+
+    * **grid** (`tuple`)
+        Nodes and weights of the Gauss-Hermite quadrature.
+
+    * **x_i** (`ndarray`)
+        First random variable at the nodes.
+
+    * **dx_i** (`ndarray`)
+        Derivative of the first random variable with respect to `z1` at the nodes.
+
+    * **m_i**, **m_j** (`float`)
+        Means of the random variables.
+
+    * **s_i**, **s_j** (`float`)
+        Standard deviations of the random variables.
+
+    * **marginal_j** (`object`)
+        Marginal distribution of the second random variable. If `None`, it is standard normal.
+
+    **Output**
+    * **rho_x** (`float`)
+        Correlation coefficent in X.
+
+    * **d_rho_x** (`float`)
+        Derivative of `rho_x` with respect to `rho_z`.
+    """
+
+    u, v, w = grid
+
+    z_j = rho_z * u + np.sqrt(1 - rho_z ** 2) * v
+    x_j, dx_j = _nataf_marginal(z_j, marginal_j)
+
+    rho_x = (np.sum(w * x_i * x_j) - m_i * m_j) / (s_i * s_j)
+
+    # Price's theorem: the derivative of E[x1 x2] with respect to `rho_z` is E[dx1/dz1 dx2/dz2].
+    d_rho_x = np.sum(w * dx_i * dx_j) / (s_i * s_j)
+
+    return rho_x, d_rho_x
+
+
+def _nataf_family(marginal):
+    """
+    Private method identifying the marginal distributions with closed-form Nataf correction factors.
+
+    **Input:**
+    * **marginal** (`object`)
+        Marginal distribution.
+
+    **Output**
+    * **family** (`str`)
+        Name of the family, or `None` if it is not available in closed form.
+
+    * **delta** (`float`)
+        Coefficient of variation of the standardized distribution (only for the families in which the correction
+        factor depends on it).
+    """
+
+    # Imported here because the distributions depend on this module.
+    from reliapy.distributions.continuous import Normal, LogNormal, Gumbel_R, WeibullMin, Gamma, Uniform, Expon
+
+    if isinstance(marginal, Normal):
+        return 'normal', None
+    elif isinstance(marginal, Uniform):
+        return 'uniform', None
+    elif isinstance(marginal, Expon):
+        return 'expon', None
+    elif isinstance(marginal, Gumbel_R):
+        return 'gumbel', None
+    elif isinstance(marginal, LogNormal):
+        return 'lognormal', np.sqrt(np.exp(marginal.s ** 2) - 1)
+    elif isinstance(marginal, Gamma):
+        return 'gamma', 1 / np.sqrt(marginal.a)
+    elif isinstance(marginal, WeibullMin):
+        g1 = sp.special.gamma(1 + 1 / marginal.c)
+        g2 = sp.special.gamma(1 + 2 / marginal.c)
+        return 'weibull', np.sqrt(g2 - g1 ** 2) / g1
+    else:
+        return None, None
+
+
+def _nataf_closed_form(rho_x, marginal_i, marginal_j):
+    """
+    Private method computing the correlation coefficient in Z using the correction factors `F = rho_z / rho_x` of
+    Der Kiureghian and Liu (1986). The fitted factors are used only for coefficients of variation between 0.1 and 0.5
+    and for `|rho_x| <= 0.9`; the other pairs are left to the quadrature.
+
+    **Input:**
+    * **rho_x** (`float`)
+        Correlation coefficient in X.
+
+    * **marginal_i** (`object`)
+        Marginal distribution of the first random variable.
+
+    * **marginal_j** (`object`)
+        Marginal distribution of the second random variable.
+
+    **Output**
+    * **rho_z** (`float`)
+        Correlation coefficent in Z, or `None` if the pair is not available in closed form.
+    """
+
+    family_i, d_i = _nataf_family(marginal_i)
+    family_j, d_j = _nataf_family(marginal_j)
+
+    if family_i is None or family_j is None:
+        return None
+    elif rho_x == 0:
+        return 0.0
+
+    # Sort the pair according to the order of the table.
+    order = ['normal', 'uniform', 'expon', 'gumbel', 'lognormal', 'gamma', 'weibull']
+    if order.index(family_i) > order.index(family_j):
+        family_i, family_j = family_j, family_i
+        d_i, d_j = d_j, d_i
+
+    r = rho_x
+    pair = (family_i, family_j)
+
+    # Apart from the exact correction factors, the approximations were fitted for coefficients of variation
+    # 0.1 <= delta <= 0.5 and are badly wrong outside that range, as well as for strong correlations.
+    if pair not in [('normal', 'normal'), ('normal', 'lognormal'), ('lognormal', 'lognormal')]:
+        if abs(r) > _NATAF_RHO_MAX:
+            return None
+
+        for d in [d_i, d_j]:
+            if d is not None and not _NATAF_DELTA_RANGE[0] <= d <= _NATAF_DELTA_RANGE[1]:
+                return None
+    if pair == ('normal', 'normal'):
+        F = 1.0
+    elif pair == ('normal', 'uniform'):
+        F = 1.023
+    elif pair == ('normal', 'expon'):
+        F = 1.107
+    elif pair == ('normal', 'gumbel'):
+        F = 1.031
+    elif pair == ('normal', 'lognormal'):
+        F = d_j / np.sqrt(np.log(1 + d_j ** 2))
+    elif pair == ('normal', 'gamma'):
+        F = 1.001 - 0.007 * d_j + 0.118 * d_j ** 2
+    elif pair == ('normal', 'weibull'):
+        F = 1.031 - 0.195 * d_j + 0.328 * d_j ** 2
+    elif pair == ('uniform', 'uniform'):
+        F = 1.047 - 0.047 * r ** 2
+    elif pair == ('uniform', 'expon'):
+        F = 1.133 + 0.029 * r ** 2
+    elif pair == ('uniform', 'gumbel'):
+        F = 1.055 + 0.015 * r ** 2
+    elif pair == ('uniform', 'lognormal'):
+        F = 1.019 + 0.014 * d_j + 0.010 * r ** 2 + 0.249 * d_j ** 2
+    elif pair == ('uniform', 'gamma'):
+        F = 1.023 - 0.007 * d_j + 0.002 * r ** 2 + 0.127 * d_j ** 2
+    elif pair == ('uniform', 'weibull'):
+        F = 1.061 - 0.237 * d_j - 0.005 * r ** 2 + 0.379 * d_j ** 2
+    elif pair == ('expon', 'expon'):
+        F = 1.229 - 0.367 * r + 0.153 * r ** 2
+    elif pair == ('expon', 'gumbel'):
+        F = 1.142 - 0.154 * r + 0.031 * r ** 2
+    elif pair == ('expon', 'lognormal'):
+        F = 1.098 + 0.003 * r + 0.019 * d_j + 0.025 * r ** 2 + 0.303 * d_j ** 2 - 0.437 * r * d_j
+    elif pair == ('expon', 'gamma'):
+        F = 1.104 + 0.003 * r - 0.008 * d_j + 0.014 * r ** 2 + 0.173 * d_j ** 2 - 0.296 * r * d_j
+    elif pair == ('expon', 'weibull'):
+        F = 1.147 + 0.145 * r - 0.271 * d_j + 0.010 * r ** 2 + 0.459 * d_j ** 2 - 0.467 * r * d_j
+    elif pair == ('gumbel', 'gumbel'):
+        F = 1.064 - 0.069 * r + 0.005 * r ** 2
+    elif pair == ('gumbel', 'lognormal'):
+        F = 1.029 + 0.001 * r + 0.014 * d_j + 0.004 * r ** 2 + 0.233 * d_j ** 2 - 0.197 * r * d_j
+    elif pair == ('gumbel', 'gamma'):
+        F = 1.031 + 0.001 * r - 0.007 * d_j + 0.003 * r ** 2 + 0.131 * d_j ** 2 - 0.132 * r * d_j
+    elif pair == ('gumbel', 'weibull'):
+        F = 1.064 + 0.065 * r - 0.210 * d_j + 0.003 * r ** 2 + 0.356 * d_j ** 2 - 0.211 * r * d_j
+    elif pair == ('lognormal', 'lognormal'):
+        F = np.log(1 + r * d_i * d_j) / (r * np.sqrt(np.log(1 + d_i ** 2) * np.log(1 + d_j ** 2)))
+    elif pair == ('lognormal', 'gamma'):
+        F = (1.001 + 0.033 * r + 0.004 * d_i - 0.016 * d_j + 0.002 * r ** 2 + 0.223 * d_i ** 2 + 0.130 * d_j ** 2
+             - 0.104 * r * d_i + 0.029 * d_i * d_j - 0.119 * r * d_j)
+    elif pair == ('lognormal', 'weibull'):
+        F = (1.031 + 0.052 * r + 0.011 * d_i - 0.210 * d_j + 0.002 * r ** 2 + 0.220 * d_i ** 2 + 0.350 * d_j ** 2
+             + 0.005 * r * d_i + 0.009 * d_i * d_j - 0.174 * r * d_j)
+    elif pair == ('gamma', 'gamma'):
+        F = (1.002 + 0.022 * r - 0.012 * (d_i + d_j) + 0.001 * r ** 2 + 0.125 * (d_i ** 2 + d_j ** 2)
+             - 0.077 * r * (d_i + d_j) + 0.014 * d_i * d_j)
+    elif pair == ('gamma', 'weibull'):
+        F = (1.032 + 0.034 * r - 0.007 * d_i - 0.202 * d_j + 0.121 * d_i ** 2 + 0.339 * d_j ** 2 - 0.006 * r * d_i
+             + 0.003 * d_i * d_j - 0.111 * r * d_j)
+    else:
+        F = (1.063 - 0.004 * r - 0.200 * (d_i + d_j) - 0.001 * r ** 2 + 0.337 * (d_i ** 2 + d_j ** 2)
+             + 0.007 * r * (d_i + d_j) - 0.007 * d_i * d_j)
+
+    rho_z = F * rho_x
+
+    # The approximations are not valid if they lead to an inadmissible correlation.
+    if not -1 < rho_z < 1:
+        return None
+
+    return rho_z
+
+
+# Range of the coefficients of variation and of the correlation in X where the approximations of Der Kiureghian and
+# Liu (1986) are used.
+_NATAF_DELTA_RANGE = (0.1, 0.5)
+_NATAF_RHO_MAX = 0.9
+
+
+def _nataf_dblquad(Cx, max_iter=5, tol=1e-10):
+    """
+    Private method implementing the Nataf model using the adaptive integration of `_func_nataf`.
+
+    **Input:**
+    * **Cx** (`ndarray`)
+        Correlation matrix in X.
+
     * **max_iter** (`int`)
         Maximum number of iterations.
 
@@ -174,6 +689,64 @@ def beta2pf(beta):
     return pf
 
 
+def x2z(X, distribution=None):
+    """
+    Transform `X` into the standard normal space, `z = phi_icdf(cdf(X))`. The lower tail is computed from the
+    logarithm of the CDF and the upper tail from the logarithm of the survival function, so that the precision is kept
+    where the CDF rounds to 0 or 1.
+
+    **Input:**
+    * **X** (`float`, `ndarray`)
+        Argument.
+
+    * **distribution** (`object`)
+        Marginal probability distribution.
+
+    **Output**
+    * **z** (`float`, `ndarray`)
+        Values in the standard normal space.
+    """
+    return _log_to_z(distribution.logcdf(X), distribution.logsf(X))
+
+
+def z2x(Z, distribution=None):
+    """
+    Transform `Z` from the standard normal space, `x = icdf(phi_cdf(Z))`. The upper tail uses the inverse survival
+    function, `x = isf(phi_cdf(-Z))`, since `phi_cdf(Z)` rounds to 1 there.
+
+    **Input:**
+    * **Z** (`float`, `ndarray`)
+        Values in the standard normal space.
+
+    * **distribution** (`object`)
+        Marginal probability distribution.
+
+    **Output**
+    * **x** (`float`, `ndarray`)
+        Transformed values.
+    """
+    Z = np.asarray(Z, dtype=float)
+    z = Z.ravel()
+    x = np.empty(z.shape)
+
+    lower = z <= 0
+    if np.any(lower):
+        x[lower] = distribution.icdf(ndtr(z[lower]))
+
+    if not np.all(lower):
+        x[~lower] = distribution.isf(ndtr(-z[~lower]))
+
+    return x.reshape(Z.shape)[()]
+
+
+def _log_to_z(log_cdf, log_sf):
+    # Standard normal value from the logarithms of the CDF and of the survival function, using the smaller of the two.
+    log_cdf = np.asarray(log_cdf, dtype=float)
+    log_sf = np.asarray(log_sf, dtype=float)
+
+    return np.where(log_cdf <= log_sf, ndtri_exp(log_cdf), -ndtri_exp(log_sf))[()]
+
+
 def normal_equivalent(X, distribution=None):
     """
     Get the mean and standard deviation for the equivalent normal distribution.
@@ -193,18 +766,88 @@ def normal_equivalent(X, distribution=None):
         Equivalent standard deviation.
 
     """
-    q = distribution.cdf(X=X)
-    z = phi_icdf(q)
-    zf = phi_pdf(z)
-    xf = distribution.pdf(X)
+    z = x2z(X, distribution=distribution)
 
-    std_eq = zf / xf
+    # Ratio of the PDFs in logarithmic scale, as both may underflow in the tails.
+    std_eq = np.exp(norm.logpdf(z) - distribution.logpdf(X))
     mu_eq = X - z * std_eq
 
     return mu_eq, std_eq
 
 
-def transform_xz(X, distributions=None):
+def normal_equivalent_batch(X, marginal=None):
+    """
+    Get the mean and standard deviation for the equivalent normal distributions of all the random variables at once.
+    The marginal distributions are grouped by family, and the logarithms of the CDF, survival function and PDF of each
+    group are evaluated with a single call to scipy.stats.
+
+    **Input:**
+    * **X** (`ndarray`)
+        Argument, with one value per random variable.
+
+    * **marginal** (`list`)
+        List of marginal probability distributions.
+
+    **Output**
+    * **M_eq** (`ndarray`)
+        Array of equivalent means.
+
+    * **D_eq** (`ndarray`)
+        Array of equivalent standard deviations.
+
+    """
+    X = np.asarray(X, dtype=float)
+
+    if len(X) != len(marginal):
+        shape_error('X or marginal')
+
+    log_cdf = np.empty(len(X))
+    log_sf = np.empty(len(X))
+    log_f = np.empty(len(X))
+    for prob, idx, params in _group_marginals(marginal):
+        if prob is None:
+            log_cdf[idx] = marginal[idx[0]].logcdf(X[idx[0]])
+            log_sf[idx] = marginal[idx[0]].logsf(X[idx[0]])
+            log_f[idx] = marginal[idx[0]].logpdf(X[idx[0]])
+        else:
+            log_cdf[idx] = prob.logcdf(X[idx], **params)
+            log_sf[idx] = prob.logsf(X[idx], **params)
+            log_f[idx] = prob.logpdf(X[idx], **params)
+
+    # The tails are handled as in `x2z` and `normal_equivalent`.
+    z = _log_to_z(log_cdf, log_sf)
+
+    D_eq = np.exp(norm.logpdf(z) - log_f)
+    M_eq = X - z * D_eq
+
+    return M_eq, D_eq
+
+
+def _group_marginals(marginal):
+    # Group the marginal distributions sharing the same scipy.stats distribution and parameter names, so that each
+    # group can be evaluated with array parameters. Distributions without a scipy.stats counterpart, or tabulated, are
+    # kept alone.
+    groups = {}
+    for i, m in enumerate(marginal):
+        prob = getattr(m, '_prob', None)
+        if prob is None or getattr(m, '_tabulated', False):
+            groups[('single', i)] = (None, [i])
+        else:
+            key = (id(prob), tuple(m._params))
+            if key not in groups:
+                groups[key] = (prob, [])
+            groups[key][1].append(i)
+
+    for prob, idx in groups.values():
+        idx = np.array(idx)
+        if prob is None:
+            yield prob, idx, None
+        else:
+            params = {k: np.array([marginal[i]._params[k] for i in idx]) for k in marginal[idx[0]]._params}
+            yield prob, idx, params
+
+
+def transform_xz(X, distributions=None, diagonal=False):
     """
     Get the Jacobian from X to Z and vice-versa.
 
@@ -215,6 +858,10 @@ def transform_xz(X, distributions=None):
     * **distribution** (`object`)
         Marginal probability distribution.
 
+    * **diagonal** (`bool`)
+        If True, the Jacobians are returned as the vectors with their diagonals instead of dense diagonal matrices,
+        so that they can be applied by broadcasting in high-dimensional problems.
+
     **Output**
     * **Jxz** (`ndarray`)
         Jacobian from Z to X.
@@ -229,20 +876,14 @@ def transform_xz(X, distributions=None):
         Array of equivalent standard deviations.
 
     """
-    nrv = len(X)
+    M_eq, D_eq = normal_equivalent_batch(X, marginal=distributions.marginal)
 
-    M_eq = []
-    D_eq = []
-    for i in range(nrv):
-        mu_eq, std_eq = normal_equivalent(X[i], distribution=distributions.marginal[i])
-        M_eq.append(mu_eq)
-        D_eq.append(std_eq)
-
-    M_eq = np.array(M_eq)
-    D_eq = np.array(D_eq)
-
-    Jxz = np.diag(D_eq)
-    Jzx = np.diag(np.reciprocal(D_eq))
+    if diagonal:
+        Jxz = D_eq
+        Jzx = np.reciprocal(D_eq)
+    else:
+        Jxz = np.diag(D_eq)
+        Jzx = np.diag(np.reciprocal(D_eq))
 
     return Jxz, Jzx, M_eq, D_eq
 
@@ -264,12 +905,12 @@ def spectral_decomposition(Cz):
 
     """
 
-    L, A_ = sp.linalg.eig(Cz)
-    Lsqrt = np.sqrt(np.real(L))
-    A = A_ @ np.diag(np.reciprocal(Lsqrt))
+    # Cz is symmetric, so Cz = V diag(L) V^T with V orthogonal and no inverse is needed.
+    L, V = np.linalg.eigh(Cz)
+    Lsqrt = np.sqrt(L)
 
-    Jyz = A.T
-    Jzy = np.linalg.inv(A.T)
+    Jyz = np.reciprocal(Lsqrt)[:, None] * V.T
+    Jzy = V * Lsqrt[None, :]
 
     return Jyz, Jzy
 
@@ -293,15 +934,17 @@ def cholesky_decomposition(Cz):
 
     L = np.linalg.cholesky(Cz)
 
-    Jyz = np.linalg.inv(L)
+    Jyz = sp.linalg.solve_triangular(L, np.eye(len(L)), lower=True)
     Jzy = L
 
     return Jyz, Jzy
 
 
-def numerical_gradient(X, fun):
+def numerical_gradient(X, fun, f0=None, fun_batch=None, scheme='central', h=None, scale=None):
     """
-    Numerical gradient of a given function `fun` using finite differences.
+    Numerical gradient of a given function `fun` using finite differences. The perturbed points are assembled in a
+    single stencil matrix and evaluated in one batch; for systems, all the components are extracted from the same
+    evaluations. The step of each variable is `h` times the largest value between its magnitude and its `scale`.
 
     **Input:**
     * **X** (`float`)
@@ -310,61 +953,88 @@ def numerical_gradient(X, fun):
     * **fun** (`callable`)
         Function.
 
+    * **f0** (`float` or `tuple`)
+        Value of `fun` at `X`, if already available.
+
+    * **fun_batch** (`callable`)
+        Function evaluating `fun` for all the rows of a matrix at once. If `None`, `fun` is called for each row.
+
+    * **scheme** (`str`)
+        Finite difference scheme: `forward` (`nrv` evaluations besides `f0`), `central` (`2 nrv` evaluations), or
+        `complex` (complex step, `nrv` evaluations of a function accepting complex arguments).
+
+    * **h** (`float`)
+        Relative step. If `None`, it is `1.5e-8` for `forward`, `1e-6` for `central`, and `1e-20` for `complex`.
+
+    * **scale** (`ndarray`)
+        Typical scale of each variable (e.g., the standard deviation). If `None`, it is equal to one.
+
     **Output**
     * **gradient** (`ndarray`)
-        Gradient of `fun`.
+        Gradient of `fun` with shape `(nrv,)`, or `(n_lse, nrv)` for systems.
 
     """
 
-    g = fun(X)
+    if scheme not in ['forward', 'central', 'complex']:
+        not_implemented_error()
+
+    if h is None:
+        h = {'forward': 1.5e-8, 'central': 1e-6, 'complex': 1e-20}[scheme]
+
+    if f0 is None:
+        g = fun(X)
+    else:
+        g = f0
+
     if isinstance(g, tuple):
-        n_lse = len(g) - 1
         system = True
     elif isinstance(g, float):
-        n_lse = 1
         system = False
     else:
         not_implemented_error()
 
+    X = np.asarray(X, dtype=float)
     nrv = len(X)
-    h = 1e-6
-    gradient = []
-    if system:
-
-        for k in range(n_lse):
-
-            df = []
-            for i in range(nrv):
 
-                x0 = copy.copy(X)
-                x0[i] = x0[i] + h
-                f0 = fun(x0)
-                f0 = f0[k + 1]
+    if scale is None:
+        scale = np.ones(nrv)
 
-                x1 = copy.copy(X)
-                x1[i] = x1[i] - h
-                f1 = fun(x1)
-                f1 = f1[k + 1]
-
-                df_ = (f0 - f1) / (2 * h)
-                df.append(df_)
-
-            gradient.append(df)
+    step = h * np.maximum(np.abs(X), scale)
+    if scheme != 'complex':
+        # Use steps that are exactly representable when added to X.
+        step = (X + step) - X
 
+    if scheme == 'complex':
+        stencil = np.tile(X.astype(complex), (nrv, 1))
+        stencil[np.arange(nrv), np.arange(nrv)] += 1j * step
+    elif scheme == 'forward':
+        stencil = np.tile(X, (nrv, 1))
+        stencil[np.arange(nrv), np.arange(nrv)] += step
     else:
+        # The first `nrv` rows are perturbed forward and the last `nrv` rows backward.
+        stencil = np.tile(X, (2 * nrv, 1))
+        stencil[np.arange(nrv), np.arange(nrv)] += step
+        stencil[nrv + np.arange(nrv), np.arange(nrv)] -= step
 
-        for i in range(nrv):
-
-            x0 = copy.copy(X)
-            x0[i] = x0[i] + h
-            f0 = fun(x0)
+    if fun_batch is None:
+        f = np.array([fun(stencil[i]) for i in range(len(stencil))])
+    else:
+        f = np.asarray(fun_batch(stencil))
 
-            x1 = copy.copy(X)
-            x1[i] = x1[i] - h
-            f1 = fun(x1)
+    if system:
+        step = step[:, None]
 
-            df = (f0 - f1) / (2 * h)
+    if scheme == 'complex':
+        df = np.imag(f) / step
+    elif scheme == 'forward':
+        df = (np.real(f) - np.array(g, dtype=float)) / step
+    else:
+        df = (np.real(f[:nrv]) - np.real(f[nrv:])) / (2 * step)
 
-            gradient.append(df)
+    if system:
+        # Skip the first response, which is not a component of the system.
+        gradient = df[:, 1:].T
+    else:
+        gradient = df
 
     return gradient
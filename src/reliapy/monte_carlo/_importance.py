@@ -110,21 +110,15 @@ class Importance:
             not_implemented_error()
 
         # Get the Jacobian for the transformation between Z and Y, and vice-versa.
-        if self.sampling_obj.distribution_obj.decomposition == 'spectral':
-            _, Jzy = spectral_decomposition(self.sampling_obj.distribution_obj.Cz)
-        elif self.sampling_obj.distribution_obj.decomposition == 'cholesky':
-            _, Jzy = cholesky_decomposition(self.sampling_obj.distribution_obj.Cz)
-        else:
-            not_implemented_error()
+        _, Jzy = self.sampling_obj.distribution_obj.decompose()
 
         # Transform the design point in Y to Z.
         z_design = Jzy @ y_design
 
         # Find the value of the design point in X.
-        u = phi_cdf(z_design)
         x_design = []
         for j in range(self.sampling_obj.nrv):
-            x_ = self.sampling_obj.marginal[j].icdf(u[j])
+            x_ = z2x(z_design[j], distribution=self.sampling_obj.marginal[j])
             x_design.append(x_)
 
         # Get `n_sim` random samples.
@@ -138,13 +132,11 @@ class Importance:
             self.limit_state_obj.run(X=x)
             g = self.limit_state_obj.g
 
-            num_failure = 0
-            for i in range(self.n_sim):
-                f = self.sampling_obj.distribution_obj.joint_pdf(x[i, :])
-                h = self.sampling_obj.distribution_obj.joint_pdf(x_original[i, :])
-                r = f/h
-                if g[i] < 0:
-                    num_failure = num_failure + r
+            # Importance weights from the difference of the logarithms of the joint PDFs.
+            log_f = self.sampling_obj.distribution_obj.joint_logpdf(x)
+            log_h = self.sampling_obj.distribution_obj.joint_logpdf(x_original)
+            r = np.exp(log_f - log_h)
+            num_failure = np.sum(r[g < 0])
 
             # Compute the probability of failure.
             self.pf = num_failure / self.n_sim
@@ -165,21 +157,17 @@ class Importance:
             self.limit_state_obj.run(X=x_)
             g_ = self.limit_state_obj.g
 
-            # Get the number of samples in the failure domain.
-            num_failure = 0
-            num_failure_ = 0
-            for i in range(self.n_sim):
-                f = self.sampling_obj.distribution_obj.joint_pdf(x[i, :])
-                h = self.sampling_obj.distribution_obj.joint_pdf(x_original[i, :])
-                r = f / h
-                if g[i] < 0:
-                    num_failure = num_failure + r
-
-                f_ = self.sampling_obj.distribution_obj.joint_pdf(x_[i, :])
-                h_ = self.sampling_obj.distribution_obj.joint_pdf(x_original_[i, :])
-                r_ = f_ / h_
-                if g_[i] < 0:
-                    num_failure_ = num_failure_ + r_
+            # Get the number of samples in the failure domain, with importance weights from the difference of the
+            # logarithms of the joint PDFs.
+            log_f = self.sampling_obj.distribution_obj.joint_logpdf(x)
+            log_h = self.sampling_obj.distribution_obj.joint_logpdf(x_original)
+            r = np.exp(log_f - log_h)
+            num_failure = np.sum(r[g < 0])
+
+            log_f_ = self.sampling_obj.distribution_obj.joint_logpdf(x_)
+            log_h_ = self.sampling_obj.distribution_obj.joint_logpdf(x_original_)
+            r_ = np.exp(log_f_ - log_h_)
+            num_failure_ = np.sum(r_[g_ < 0])
 
             # Compute the probability of failure.
             pf = num_failure / self.n_sim
@@ -36,12 +36,22 @@ class MonteCarlo:
     * **beta** (`float`)
         Reliability index.
 
+    * **chunk_size** (`int`)
+        If not `None`, the samples are generated and evaluated in chunks of `chunk_size` samples, and only the number
+        of failures is kept in memory.
+
+    * **keep_failures** (`bool`)
+        If `True` and `chunk_size` is not `None`, keep the samples in the failure domain in the ``LimitState`` object.
+
     """
 
-    def __init__(self, limit_state_obj=None, sampling_obj=None, n_sim=None, n_tasks=1, random_state=None):
+    def __init__(self, limit_state_obj=None, sampling_obj=None, n_sim=None, n_tasks=1, random_state=None,
+                 chunk_size=None, keep_failures=False):
         self.sampling_obj = sampling_obj
         self.n_sim = n_sim
         self.n_tasks = n_tasks
+        self.chunk_size = chunk_size
+        self.keep_failures = keep_failures
         self.limit_state_obj = limit_state_obj
         self.random_state = random_state
         self.pf = None
@@ -55,16 +65,19 @@ class MonteCarlo:
         Run Monte Carlo simulation.
         """
 
+        if self.chunk_size is not None:
+            self._run_stream()
+
         # Get `n_sim` random samples.
-        if isinstance(self.sampling_obj, LHS) or isinstance(self.sampling_obj, Random):
+        elif isinstance(self.sampling_obj, LHS) or isinstance(self.sampling_obj, Random):
             x = self.sampling_obj.rvs(n_sim=self.n_sim)
 
             # Evaluate the limit state functions for the random samples.
             self.limit_state_obj.run(X=x)
             g = self.limit_state_obj.g
 
-            if isinstance(g[0], tuple):
-                n_lse = len(g) - 1
+            if isinstance(g[0], tuple) or np.ndim(g) == 2:
+                n_lse = len(g[0]) - 1
                 system = True
             elif isinstance(g[0], float):
                 n_lse = 1
@@ -75,14 +88,10 @@ class MonteCarlo:
             # Get the number of samples in the failure domain.
             if system:
                 g = np.array(g)
-                num_failure = 0
-                for i in range(self.n_sim):
-
-                    if g[i, 0] < 0:
-                        num_failure = num_failure + 1
+                num_failure = np.sum(g[:, 0] < 0)
 
             else:
-                num_failure = sum(I < 0 for I in g)
+                num_failure = np.sum(np.asarray(g) < 0)
 
             # Compute the probability of failure.
             self.pf = num_failure / self.n_sim
@@ -109,3 +118,43 @@ class MonteCarlo:
 
         self.beta = pf2beta(self.pf)
 
+    def _run_stream(self):
+        """
+        Private method running the Monte Carlo simulation with samples generated and evaluated in chunks.
+        """
+
+        if not (isinstance(self.sampling_obj, LHS) or isinstance(self.sampling_obj, Random)):
+            not_implemented_error()
+
+        if not isinstance(self.chunk_size, int):
+            type_error('chunk_size', 'int')
+        elif self.chunk_size < 1:
+            value_error('chunk_size')
+
+        # A seed would generate the same samples in every chunk, so a single generator is used for all of them.
+        random_state = self.sampling_obj.random_state
+        if random_state is not None and not isinstance(random_state, np.random.RandomState):
+            self.sampling_obj.random_state = np.random.RandomState(random_state)
+
+        try:
+            self.limit_state_obj.stream(samples=self._chunks(), keep_failures=self.keep_failures)
+        finally:
+            self.sampling_obj.random_state = random_state
+
+        n_failure = self.limit_state_obj.n_failure
+        if np.ndim(n_failure) > 0:
+            n_failure = n_failure[0]
+
+        # Compute the probability of failure.
+        self.pf = n_failure / self.n_sim
+
+    def _chunks(self):
+        """
+        Private generator of chunks of `chunk_size` random samples until `n_sim` samples are generated.
+        """
+
+        n_done = 0
+        while n_done < self.n_sim:
+            n_chunk = min(self.chunk_size, self.n_sim - n_done)
+            yield self.sampling_obj.rvs(n_sim=n_chunk)
+            n_done = n_done + n_chunk
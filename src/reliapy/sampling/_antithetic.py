@@ -48,16 +48,13 @@ class Antithetic:
         self.random_state = distribution_obj.random_state
         self.decomposition = distribution_obj.decomposition
 
-        mean = []
-        std = []
-        for i in range(self.nrv):
-            m = distribution_obj.marginal[i].stats[0]
-            s = np.sqrt(distribution_obj.marginal[i].stats[1])
-            mean.append(m)
-            std.append(s)
+    @property
+    def mean(self):
+        return self.distribution_obj.mean
 
-        self.mean = np.array(mean)
-        self.std = np.array(std)
+    @property
+    def std(self):
+        return self.distribution_obj.std
 
     def rvs(self, n_sim=1):
         """
@@ -73,12 +70,7 @@ class Antithetic:
 
         """
 
-        if self.decomposition == 'spectral':
-            _, Jzy = spectral_decomposition(self.Cz)
-        elif self.decomposition == 'cholesky':
-            _, Jzy = cholesky_decomposition(self.Cz)
-        else:
-            not_implemented_error()
+        _, Jzy = self.distribution_obj.decompose(self.decomposition)
 
         # y = norm.rvs(loc=0, scale=1, size=(self.nrv, n_sim), random_state=self.random_state)
         # z = Jzy @ y
@@ -106,12 +98,10 @@ class Antithetic:
             xj = []
             xj_ = []
             for j in range(self.nrv):
-                p0 = phi_cdf(zj[j])
-                x_ = self.marginal[j].icdf(p0)
+                x_ = z2x(zj[j], distribution=self.marginal[j])
                 xj.append(x_)
 
-                p0 = phi_cdf(zj_[j])
-                x_ = self.marginal[j].icdf(p0)
+                x_ = z2x(zj_[j], distribution=self.marginal[j])
                 xj_.append(x_)
 
             x0.append(xj)
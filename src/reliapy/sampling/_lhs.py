@@ -55,16 +55,13 @@ class LHS:
         self.decomposition = distribution_obj.decomposition
         self.method = method
 
-        mean = []
-        std = []
-        for i in range(self.nrv):
-            m = distribution_obj.marginal[i].stats[0]
-            s = np.sqrt(distribution_obj.marginal[i].stats[1])
-            mean.append(m)
-            std.append(s)
+    @property
+    def mean(self):
+        return self.distribution_obj.mean
 
-        self.mean = np.array(mean)
-        self.std = np.array(std)
+    @property
+    def std(self):
+        return self.distribution_obj.std
 
     def rvs(self, n_sim=1):
         """
@@ -80,12 +77,7 @@ class LHS:
 
         """
 
-        if self.decomposition == 'spectral':
-            _, Jzy = spectral_decomposition(self.Cz)
-        elif self.decomposition == 'cholesky':
-            _, Jzy = cholesky_decomposition(self.Cz)
-        else:
-            not_implemented_error()
+        _, Jzy = self.distribution_obj.decompose(self.decomposition)
 
         # Get a matrix of random permuations in each column.
         arr = np.arange(1, n_sim+1)
@@ -118,8 +110,7 @@ class LHS:
             zj = Jzy @ yj0
             xj = []
             for j in range(self.nrv):
-                p0 = phi_cdf(zj[j])
-                x_ = self.marginal[j].icdf(p0)
+                x_ = z2x(zj[j], distribution=self.marginal[j])
                 xj.append(x_)
 
             x.append(xj)
@@ -1,7 +1,7 @@
 from reliapy._messages import *
+from reliapy.math import z2x
 from scipy.stats import norm
 import numpy as np
-from reliapy.math import spectral_decomposition, cholesky_decomposition
 
 
 class Random:
@@ -51,16 +51,13 @@ class Random:
         self.random_state = distribution_obj.random_state
         self.decomposition = distribution_obj.decomposition
 
-        mean = []
-        std = []
-        for i in range(self.nrv):
-            m = distribution_obj.marginal[i].stats[0]
-            s = np.sqrt(distribution_obj.marginal[i].stats[1])
-            mean.append(m)
-            std.append(s)
+    @property
+    def mean(self):
+        return self.distribution_obj.mean
 
-        self.mean = np.array(mean)
-        self.std = np.array(std)
+    @property
+    def std(self):
+        return self.distribution_obj.std
 
     def rvs(self, n_sim=1):
         """
@@ -76,27 +73,14 @@ class Random:
 
         """
 
-        if self.decomposition == 'spectral':
-            _, Jzy = spectral_decomposition(self.Cz)
-        elif self.decomposition == 'cholesky':
-            _, Jzy = cholesky_decomposition(self.Cz)
-        else:
-            not_implemented_error()
+        _, Jzy = self.distribution_obj.decompose(self.decomposition)
 
         y = norm.rvs(loc=0, scale=1, size=(self.nrv, n_sim), random_state=self.random_state)
         z = Jzy @ y
 
-        x = []
-        for i in range(n_sim):
-            u = norm.cdf(z[:, i], loc=0, scale=1)
-
-            xj = []
-            for j in range(self.nrv):
-                x_ = self.marginal[j].icdf(u[j])
-                xj.append(x_)
-
-            x.append(xj)
-
-        x = np.array(x)
+        # Transform all the samples of each random variable at once.
+        x = np.empty((n_sim, self.nrv))
+        for j in range(self.nrv):
+            x[:, j] = z2x(z[j, :], distribution=self.marginal[j])
 
         return x
@@ -81,12 +81,7 @@ class FORM(Optimization):
         """
 
         # Get the Jacobians between Y and Z (and vice-versa).
-        if self.decomposition == 'spectral':
-            Jyz, Jzy = spectral_decomposition(self.distribution_obj.Cz)
-        elif self.decomposition == 'cholesky':
-            Jyz, Jzy = cholesky_decomposition(self.distribution_obj.Cz)
-        else:
-            not_implemented_error()
+        Jyz, Jzy = self.distribution_obj.decompose(self.decomposition)
 
         # Get the array with the means of the random variables.
         mean = self.distribution_obj.mean
@@ -143,26 +138,23 @@ class FORM(Optimization):
         tol_ = tol * np.linalg.norm(g0)
         itera = 0
         while itera < max_iter:
-            # Get the jacobians between X and Y (and vice versa) using the composition scheme.
-            Jxz, Jzx, M_eq, S_eq = transform_xz(x, distributions=self.distribution_obj)
-            Jxy = Jxz @ Jzy
-            Jyx = Jyz @ Jzx
+            # Get the jacobians between X and Z (and vice versa). The jacobians between X and Z are diagonal, so they
+            # are kept as vectors and the composition with Jzy and Jyz is applied by broadcasting.
+            Jxz, Jzx, M_eq, S_eq = transform_xz(x, distributions=self.distribution_obj, diagonal=True)
 
             # Transform the point x from X to Y
-            y = Jyx @ (x - M_eq)
+            y = Jyz @ (Jzx * (x - M_eq))
 
             # Get the sensitive indexes. (Not currently used. This can change in the future)
             if sys:
-                gy = self.limit_state_obj.function(x)
+                gy, dgdx = self.limit_state_obj.value_and_gradient(x)
                 gy = gy[sys_id + 1]
-                dgdx = self.limit_state_obj.gradient(x)
                 dgdx = dgdx[sys_id]
 
             else:
-                gy = self.limit_state_obj.function(x)
-                dgdx = self.limit_state_obj.gradient(x)
+                gy, dgdx = self.limit_state_obj.value_and_gradient(x)
 
-            dgdy = Jxy.T @ dgdx
+            dgdy = Jzy.T @ (Jxz * dgdx)
             # alpha = dgdy / np.linalg.norm(dgdy)
 
             # Update y.
@@ -170,7 +162,10 @@ class FORM(Optimization):
                 # y = self.iHLRF(a=a, b=b, gamma=gamma, tol=tol, tol_1=tol_1, tol_2=tol_2, max_iter=max_iter,
                 #               sys_id=sys_id)
 
-                y = self.update_iHLRF(y, gy, dgdy, gamma, a, b, mean, std, sys, sys_id, tol_)
+                # The line search maps Y to X through the correlated standard normal variables Z, so that it does not
+                # depend on the orientation of the Y basis.
+                y = self.update_iHLRF(y, gy, dgdy, gamma, a, b, mean, std, sys, sys_id, tol_,
+                                      y2x=lambda y_: mean + std * (Jzy @ y_))
 
             elif self.optimization == 'HLRF':
                 # y = self.HLRF(tol, max_iter, sys_id)
@@ -183,23 +178,21 @@ class FORM(Optimization):
             #y = c * dgdy
 
             # Transform y from Y to X.
-            x = Jxy @ y + M_eq
+            x = Jxz * (Jzy @ y) + M_eq
 
             # Evaluate g(y) and its gradient.
             if sys:
-                gy_ = self.limit_state_obj.function(x)
-                dgdx_ = self.limit_state_obj.gradient(x)
+                gy_, dgdx_ = self.limit_state_obj.value_and_gradient(x)
                 gy = gy_[sys_id + 1]
                 dgdx = dgdx_[sys_id]
 
             else:
-                gy = self.limit_state_obj.function(x)
-                dgdx = self.limit_state_obj.gradient(x)
+                gy, dgdx = self.limit_state_obj.value_and_gradient(x)
 
             # gy = self.limit_state_obj.function(x)
             # dgdx = self.limit_state_obj.gradient(x)
 
-            dgdy = Jxy.T @ dgdx
+            dgdy = Jzy.T @ (Jxz * dgdx)
 
             # Compute the errors.
             error_1 = 1 + abs(np.dot(dgdy, y) / (np.linalg.norm(dgdy) * np.linalg.norm(y)))
@@ -90,8 +90,8 @@ class FOSM(Optimization):
         else:
             not_implemented_error()
 
-        # Get the jacobian for the transformation between X and Y.
-        Jxy = np.diag(std)
+        # Get the jacobian for the transformation between X and Y. It is diagonal, so only its diagonal is stored.
+        Jxy = np.asarray(std, dtype=float)
 
         # Start the iterative problem setting x equal to the mean of the random variables.
         if n_lse == 1:
@@ -129,14 +129,13 @@ class FOSM(Optimization):
         while itera < max_iter:
 
             # Evaluate the limit state function and its gradient in X.
-            gy = self.limit_state_obj.function(x)
-            dgdx = self.limit_state_obj.gradient(x)
+            gy, dgdx = self.limit_state_obj.value_and_gradient(x)
 
             # Transform the point from X to Y
             y = (x - mean) / std
 
             # Transform the gradient from X to Y.
-            dgdy = Jxy.T @ dgdx
+            dgdy = Jxy * dgdx
 
             # Get the sensitivity indexes.
             # alpha = dgdy / np.linalg.norm(dgdy)  # todo: use of the alpha for eliminating some variables.
@@ -152,22 +151,20 @@ class FOSM(Optimization):
                 not_implemented_error()
 
             # Transform y from Y to X.
-            x = Jxy @ y + mean
+            x = Jxy * y + mean
 
             # Evaluate g(y), dg/dx and dg/dy.
             if sys:
-                gy_ = self.limit_state_obj.function(x)
-                dgdx_ = self.limit_state_obj.gradient(x)
+                gy_, dgdx_ = self.limit_state_obj.value_and_gradient(x)
                 gy = gy_[sys_id + 1]
                 dgdx = dgdx_[sys_id]
 
             else:
-                gy = self.limit_state_obj.function(x)
-                dgdx = self.limit_state_obj.gradient(x)
+                gy, dgdx = self.limit_state_obj.value_and_gradient(x)
 
             # gy = self.limit_state_obj.function(x)
             # dgdx = self.limit_state_obj.gradient(x)
-            dgdy = Jxy.T @ dgdx
+            dgdy = Jxy * dgdx
 
             # Check errors.
             error_1 = 1 + abs(np.dot(dgdy, y) / (np.linalg.norm(dgdy) * np.linalg.norm(y)))
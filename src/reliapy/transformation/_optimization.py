@@ -95,15 +95,13 @@ class Optimization:
             dxdy = std
 
             if sys:
-                g_ = self.limit_state_obj.function(x)
-                dgdx_ = self.limit_state_obj.gradient(x)
+                g_, dgdx_ = self.limit_state_obj.value_and_gradient(x)
                 g = g_[sys_id + 1]
                 dgdx = dgdx_[sys_id]
                 dgdy = dgdx * dxdy
 
             else:
-                g = self.limit_state_obj.function(x)
-                dgdx = self.limit_state_obj.gradient(x)
+                g, dgdx = self.limit_state_obj.value_and_gradient(x)
                 dgdy = dgdx * dxdy
 
             # Compute the step of the design point in Y.
@@ -231,15 +229,13 @@ class Optimization:
             dxdy = std
 
             if sys:
-                g_ = self.limit_state_obj.function(x)
-                dgdx_ = self.limit_state_obj.gradient(x)
+                g_, dgdx_ = self.limit_state_obj.value_and_gradient(x)
                 g = g_[sys_id + 1]
                 dgdx = dgdx_[sys_id]
                 dgdy = dgdx * dxdy
 
             else:
-                g = self.limit_state_obj.function(x)
-                dgdx = self.limit_state_obj.gradient(x)
+                g, dgdx = self.limit_state_obj.value_and_gradient(x)
                 dgdy = dgdx * dxdy
 
             # Get the errors.
@@ -290,7 +286,7 @@ class Optimization:
 
         return y
 
-    def update_iHLRF(self, y, g, dgdy, gamma, a, b, mean, std, sys, sys_id, tol):
+    def update_iHLRF(self, y, g, dgdy, gamma, a, b, mean, std, sys, sys_id, tol, y2x=None):
 
         c = (np.dot(dgdy, y) - g) / (np.linalg.norm(dgdy) ** 2)
         dk = c * dgdy - y
@@ -308,11 +304,11 @@ class Optimization:
         n = 0
         while True:
             y0 = y + (b ** n) * dk
-            m0 = self._merit(y0, ck, mean, std, sys, sys_id)
-            m1 = self._merit(y, ck, mean, std, sys, sys_id)
+            m0 = self._merit(y0, ck, mean, std, sys, sys_id, y2x=y2x)
+            m1 = self._merit(y, ck, mean, std, sys, sys_id, y2x=y2x)
             dm = m0 - m1
 
-            gm = self._grad_merit(y, ck, mean, std, sys, sys_id)
+            gm = self._grad_merit(y, ck, mean, std, sys, sys_id, y2x=y2x)
             dgm = -a * (b ** n) * np.linalg.norm(gm)
 
             if dm <= dgm:
@@ -324,7 +320,7 @@ class Optimization:
 
         return y
 
-    def _merit(self, y, c, mean, std, sys, sys_id):
+    def _merit(self, y, c, mean, std, sys, sys_id, y2x=None):
         """
         Merit function used in the Armijo's rule, and defined by Zhang and Kiureghian (1997).
 
@@ -341,13 +337,19 @@ class Optimization:
         * **std** (`ndarray`)
             Array with the standard deviations.
 
+        * **y2x** (`callable`)
+            Transformation from Y to X. If `None`, `x = mean + y * std`.
+
         **Output:**
         * **m** (`float`)
             Value of the merit function.
 
         """
 
-        x = mean + y * std
+        if y2x is None:
+            x = mean + y * std
+        else:
+            x = y2x(y)
         # g = self.limit_state_obj.function(x)
 
         if sys:
@@ -361,7 +363,7 @@ class Optimization:
 
         return m
 
-    def _grad_merit(self, y, c, mean, std, sys, sys_id):
+    def _grad_merit(self, y, c, mean, std, sys, sys_id, y2x=None):
         """
         Gradient of the merit function used in the Armijo's rule, and defined by Zhang and Kiureghian (1997).
 
@@ -378,6 +380,9 @@ class Optimization:
         * **std** (`ndarray`)
             Array with the standard deviations.
 
+        * **y2x** (`callable`)
+            Transformation from Y to X. If `None`, `x = mean + y * std`.
+
         **Output:**
         * **gradient** (`list`)
             Gradient of the merit function.
@@ -390,11 +395,11 @@ class Optimization:
         for i in range(nrv):
             y0 = copy.copy(y)
             y0[i] = y0[i] + h
-            f0 = self._merit(y0, c, mean, std, sys, sys_id)
+            f0 = self._merit(y0, c, mean, std, sys, sys_id, y2x=y2x)
 
             y1 = copy.copy(y)
             y1[i] = y1[i] - h
-            f1 = self._merit(y1, c, mean, std, sys, sys_id)
+            f1 = self._merit(y1, c, mean, std, sys, sys_id, y2x=y2x)
 
             df = (f0 - f1) / (2 * h)
             gradient.append(df)